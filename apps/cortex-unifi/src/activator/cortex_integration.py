@@ -19,7 +19,6 @@ Architecture:
 """
 
 import asyncio
-import json
 import os
 import uuid
 from dataclasses import dataclass, field
@@ -27,6 +26,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
+import orjson
 import redis.asyncio as redis
 import structlog
 
@@ -55,6 +55,15 @@ class CortexConfig:
     heartbeat_interval: int = 30
     heartbeat_timeout: int = 120
 
+    # Result publishing (coalesced into pipelined batches)
+    result_batch_size: int = 100
+    result_batch_window_ms: int = 5
+
+    # Pending tasks idle this long (e.g. a failed result flush, or a dead
+    # consumer) are reclaimed and processed again
+    claim_interval: int = 30
+    claim_min_idle_ms: int = 120000
+
     # Capabilities this fabric provides
     capabilities: List[str] = field(default_factory=lambda: [
         "unifi_network",
@@ -76,6 +85,10 @@ class CortexConfig:
             result_stream=os.getenv("CORTEX_RESULT_STREAM", "cortex.results"),
             consumer_group=os.getenv("CORTEX_CONSUMER_GROUP", "unifi-fabric-group"),
             heartbeat_interval=int(os.getenv("HEARTBEAT_INTERVAL", "30")),
+            result_batch_size=int(os.getenv("REDIS_BATCH_SIZE", "100")),
+            result_batch_window_ms=int(os.getenv("REDIS_BATCH_WINDOW_MS", "5")),
+            claim_interval=int(os.getenv("CORTEX_CLAIM_INTERVAL", "30")),
+            claim_min_idle_ms=int(os.getenv("CORTEX_CLAIM_MIN_IDLE_MS", "120000")),
         )
 
 
@@ -109,10 +122,10 @@ class CortexMessage:
             "sender": self.sender,
             "recipient": self.recipient,
             "task_type": self.task_type,
-            "payload": json.dumps(self.payload),
+            "payload": orjson.dumps(self.payload).decode(),
             "priority": self.priority.value,
             "timestamp": self.timestamp.isoformat(),
-            "metadata": json.dumps(self.metadata),
+            "metadata": orjson.dumps(self.metadata).decode(),
         }
 
     @classmethod
@@ -127,10 +140,10 @@ class CortexMessage:
             sender=decoded["sender"],
             recipient=decoded["recipient"],
             task_type=decoded["task_type"],
-            payload=json.loads(decoded["payload"]),
+            payload=orjson.loads(decoded["payload"]),
             priority=MessagePriority(decoded.get("priority", "normal")),
             timestamp=datetime.fromisoformat(decoded["timestamp"]),
-            metadata=json.loads(decoded.get("metadata", "{}")),
+            metadata=orjson.loads(decoded.get("metadata", "{}")),
         )
 
 
@@ -144,6 +157,137 @@ class AgentStatus(str, Enum):
     STOPPED = "stopped"
 
 
+# =============================================================================
+# Result Batcher
+# =============================================================================
+
+# Queued by ResultBatcher.stop(): the flush loop ships its batch and exits
+_STOP = object()
+
+
+class ResultBatcher:
+    """
+    Coalesces result publishing into pipelined Redis round-trips.
+
+    Results are queued and flushed once result_batch_size items are waiting
+    or result_batch_window_ms has passed since the first one was queued.
+    Each flush is a single non-transactional pipeline carrying the XADD for
+    every result, the XACK for its originating task, and the task counter.
+    """
+
+    def __init__(self, client: redis.Redis, config: CortexConfig):
+        self.config = config
+        self._client = client
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and ship anything still queued."""
+        if self._task:
+            # Not cancelled: the loop ships whatever it has collected, then exits
+            self._queue.put_nowait(_STOP)
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        # Anything the loop never reached (it died, or results arrived after stop)
+        batch = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                batch.append(item)
+        if batch:
+            await self._flush(batch)
+
+    def submit(self, fields: Dict[str, str], ack_id: Optional[str] = None) -> asyncio.Future:
+        """
+        Queue a result for the next batch.
+
+        Returns a future resolving to the result's stream ID once the batch
+        ships, or None if the write failed. A failed write leaves the task
+        unacked in the consumer group's pending list, where consume_tasks()
+        reclaims it with XAUTOCLAIM once idle for claim_min_idle_ms and
+        processes it again. Callers may leave the future unawaited: failures
+        are logged by the flush, and the reclaim is the recovery path.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((fields, ack_id, future))
+        return future
+
+    async def _flush_loop(self) -> None:
+        """Drain the queue in size/time-bounded batches."""
+        loop = asyncio.get_running_loop()
+        window = self.config.result_batch_window_ms / 1000
+
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + window
+            stopping = False
+
+            while len(batch) < self.config.result_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: List[tuple]) -> None:
+        """Publish a batch of results in one pipelined round-trip."""
+        pipe = self._client.pipeline(transaction=False)
+        acked = 0
+        for fields, ack_id, _ in batch:
+            pipe.xadd(self.config.result_stream, fields, maxlen=10000)
+            if ack_id:
+                pipe.xack(self.config.task_stream, self.config.consumer_group, ack_id)
+                acked += 1
+        if acked:
+            key = f"{self.config.registry_prefix}:{self.config.agent_id}"
+            pipe.hincrby(key, "task_count", acked)
+
+        try:
+            replies = iter(await pipe.execute())
+        except Exception as e:
+            log.error("cortex_result_batch_error", error=str(e), batch_size=len(batch))
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+            return
+
+        for fields, ack_id, future in batch:
+            message_id = next(replies)
+            if ack_id:
+                next(replies)
+            message_id = message_id.decode() if isinstance(message_id, bytes) else message_id
+
+            log.info(
+                "cortex_result_published",
+                message_id=message_id,
+                task_id=fields["task_id"],
+                success=fields["success"],
+                latency_ms=fields["execution_time_ms"]
+            )
+            if not future.done():
+                future.set_result(message_id)
+
+        log.debug("cortex_result_batch_flushed", batch_size=len(batch))
+
+
 # =============================================================================
 # Cortex Integration Client
 # =============================================================================
@@ -166,6 +310,7 @@ class CortexClient:
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._consume_task: Optional[asyncio.Task] = None
         self._task_handler: Optional[Callable] = None
+        self._batcher: Optional[ResultBatcher] = None
         self._status = AgentStatus.STARTING
 
     async def connect(self) -> None:
@@ -203,7 +348,7 @@ class CortexClient:
             "status": self._status.value,
             "capabilities": ",".join(self.config.capabilities),
             "stream": self.config.task_stream,
-            "metadata": json.dumps({"fabric_type": "unifi-layer-fabric"}),
+            "metadata": orjson.dumps({"fabric_type": "unifi-layer-fabric"}).decode(),
             "registered_at": datetime.utcnow().isoformat(),
             "last_heartbeat": datetime.utcnow().isoformat(),
             "task_count": "0",
@@ -315,37 +460,53 @@ class CortexClient:
             raise
 
     async def consume_tasks(self, count: int = 10) -> AsyncIterator[CortexMessage]:
-        """Consume tasks from the task stream."""
+        """
+        Consume tasks from the task stream.
+
+        New tasks are read with XREADGROUP; every claim_interval seconds,
+        tasks left pending longer than claim_min_idle_ms (by this or any
+        other consumer in the group) are reclaimed first.
+        """
         if not self._client:
             raise RuntimeError("Not connected to Redis")
 
         consumer_name = f"{self.config.agent_id}-consumer"
+        loop = asyncio.get_running_loop()
+        next_claim = loop.time()
 
         while self._running:
             try:
-                result = await self._client.xreadgroup(
-                    self.config.consumer_group,
-                    consumer_name,
-                    {self.config.task_stream: ">"},
-                    count=count,
-                    block=5000,
-                )
-
-                if not result:
-                    continue
-
-                for stream_name, messages in result:
-                    for message_id, data in messages:
-                        msg_id = message_id.decode() if isinstance(message_id, bytes) else message_id
-                        try:
-                            message = CortexMessage.from_redis(
-                                msg_id,
-                                data,
-                                stream=self.config.task_stream
-                            )
-                            yield message
-                        except Exception as e:
-                            log.error("cortex_message_parse_error", error=str(e), message_id=msg_id)
+                messages = []
+                if loop.time() >= next_claim:
+                    next_claim = loop.time() + self.config.claim_interval
+                    messages = await self._claim_stale_tasks(consumer_name, count)
+
+                if not messages:
+                    result = await self._client.xreadgroup(
+                        self.config.consumer_group,
+                        consumer_name,
+                        {self.config.task_stream: ">"},
+                        count=count,
+                        block=5000,
+                    )
+                    if not result:
+                        continue
+                    messages = [m for _, stream_messages in result for m in stream_messages]
+
+                for message_id, data in messages:
+                    msg_id = message_id.decode() if isinstance(message_id, bytes) else message_id
+                    try:
+                        message = CortexMessage.from_redis(
+                            msg_id,
+                            data,
+                            stream=self.config.task_stream
+                        )
+                    except Exception as e:
+                        log.error("cortex_message_parse_error", error=str(e), message_id=msg_id)
+                        # Never parseable; don't leave it to be reclaimed forever
+                        await self.ack_message(msg_id)
+                        continue
+                    yield message
 
             except asyncio.CancelledError:
                 log.info("cortex_consumer_cancelled")
@@ -354,6 +515,21 @@ class CortexClient:
                 log.error("cortex_consume_error", error=str(e))
                 await asyncio.sleep(1)
 
+    async def _claim_stale_tasks(self, consumer_name: str, count: int) -> list:
+        """Take over tasks left pending in the consumer group past claim_min_idle_ms."""
+        _, claimed, *_ = await self._client.xautoclaim(
+            self.config.task_stream,
+            self.config.consumer_group,
+            consumer_name,
+            min_idle_time=self.config.claim_min_idle_ms,
+            count=count,
+        )
+        # Entries trimmed from the stream come back without data (Redis < 7)
+        claimed = [(message_id, data) for message_id, data in claimed if data]
+        if claimed:
+            log.info("cortex_tasks_reclaimed", count=len(claimed))
+        return claimed
+
     async def ack_message(self, message_id: str) -> None:
         """Acknowledge a processed message."""
         if not self._client:
@@ -384,6 +560,38 @@ class CortexClient:
         if not self._client:
             raise RuntimeError("Not connected to Redis")
 
+        result_data = self._result_fields(
+            original_message, result, success, layers_activated,
+            latency_ms, task_id, response_text
+        )
+
+        message_id = await self._client.xadd(
+            self.config.result_stream,
+            result_data,
+            maxlen=10000,
+        )
+
+        log.info(
+            "cortex_result_published",
+            message_id=message_id,
+            task_id=result_data["task_id"],
+            success=success,
+            latency_ms=latency_ms
+        )
+
+        return message_id.decode() if isinstance(message_id, bytes) else message_id
+
+    def _result_fields(
+        self,
+        original_message: CortexMessage,
+        result: Dict[str, Any],
+        success: bool,
+        layers_activated: List[str] = None,
+        latency_ms: int = 0,
+        task_id: str = None,
+        response_text: str = None,
+    ) -> Dict[str, str]:
+        """Build the result stream entry for a processed task."""
         # Extract task_id from original message if not provided
         if not task_id:
             task_id = original_message.payload.get("task_id", original_message.message_id)
@@ -393,12 +601,12 @@ class CortexClient:
             if isinstance(result, str):
                 response_text = result
             elif isinstance(result, dict):
-                response_text = result.get("message", result.get("response", json.dumps(result)))
+                response_text = result.get("message", result.get("response", orjson.dumps(result).decode()))
             else:
                 response_text = str(result)
 
         # Chat-activator compatible flat format
-        result_data = {
+        return {
             "task_id": task_id,
             "success": str(success).lower(),
             "response": response_text or "",
@@ -409,22 +617,6 @@ class CortexClient:
             "timestamp": datetime.utcnow().isoformat() + "Z",
         }
 
-        message_id = await self._client.xadd(
-            self.config.result_stream,
-            result_data,
-            maxlen=10000,
-        )
-
-        log.info(
-            "cortex_result_published",
-            message_id=message_id,
-            task_id=task_id,
-            success=success,
-            latency_ms=latency_ms
-        )
-
-        return message_id.decode() if isinstance(message_id, bytes) else message_id
-
     # -------------------------------------------------------------------------
     # Lifecycle
     # -------------------------------------------------------------------------
@@ -446,6 +638,8 @@ class CortexClient:
         await self.create_consumer_group()
 
         # Start background tasks
+        self._batcher = ResultBatcher(self._client, self.config)
+        self._batcher.start()
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
         self._consume_task = asyncio.create_task(self._consume_loop())
 
@@ -474,6 +668,11 @@ class CortexClient:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Ship results still waiting in the batcher
+        if self._batcher:
+            await self._batcher.stop()
+            self._batcher = None
+
         # Deregister and disconnect
         await self.update_status(AgentStatus.STOPPED)
         await self.deregister()
@@ -513,18 +712,26 @@ class CortexClient:
                 if self._task_handler:
                     result = await self._task_handler(message)
 
-                    # Publish result
-                    await self.publish_result(
-                        original_message=message,
-                        result=result.get("result", {}),
-                        success=result.get("success", False),
-                        layers_activated=result.get("layers_activated", []),
-                        latency_ms=result.get("latency_ms", 0),
+                    # Publish and acknowledge in the next coalesced batch,
+                    # without blocking this loop on the Redis round-trip.
+                    # Fire-and-forget: awaiting would stall this serial loop
+                    # for the batch window; a failed write is logged by the
+                    # batcher and the unacked task is reclaimed by
+                    # consume_tasks() once idle past claim_min_idle_ms.
+                    self._batcher.submit(
+                        self._result_fields(
+                            original_message=message,
+                            result=result.get("result", {}),
+                            success=result.get("success", False),
+                            layers_activated=result.get("layers_activated", []),
+                            latency_ms=result.get("latency_ms", 0),
+                        ),
+                        ack_id=message.message_id,
                     )
-
-                # Acknowledge
-                await self.ack_message(message.message_id)
-                await self.increment_task_count()
+                else:
+                    # Acknowledge
+                    await self.ack_message(message.message_id)
+                    await self.increment_task_count()
 
             except Exception as e:
                 log.error(
@@ -24,18 +24,28 @@ Integration modes:
 """
 
 import asyncio
+import logging
 import os
+import queue
+import random
 import re
+import sys
 import time
+from collections import defaultdict
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Tuple
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional, Tuple
 import httpx
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from prometheus_client import Counter, Histogram, Gauge, generate_latest
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, Gauge, generate_latest
 import structlog
 
 from cortex_integration import CortexClient, CortexConfig, CortexMessage, AgentStatus
@@ -81,13 +91,85 @@ class RoutingRule:
     compiled: Optional[re.Pattern] = None
     
     def __post_init__(self):
-        self.compiled = re.compile(self.pattern, re.IGNORECASE)
+        self.compiled = RoutingRule._build_regex(self.pattern)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_regex(pattern: str) -> re.Pattern:
+        """Compile a routing pattern once per process (256 is well above the rule-set size)."""
+        return re.compile(pattern, re.IGNORECASE)
+
+
+# =============================================================================
+# Logging
+# =============================================================================
+
+LOG_LEVEL = logging.getLevelNamesMapping().get(os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+LOG_QUEUE_SIZE = 10000
+ROUTE_LOG_SAMPLE_RATE = 0.1  # Fraction of route_matched debug events emitted
+
+
+# Configured once at import so every module-level logger (here and in the
+# imported modules) resolves to the same cached filtering bound logger.
+# Events below LOG_LEVEL are dropped before any processor runs.
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(),
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
+    logger_factory=structlog.stdlib.LoggerFactory(),
+    cache_logger_on_first_use=True,
+)
+
+log = structlog.get_logger()
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records when the queue is full instead of erroring."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # The stock handler would report this via handleError, writing a
+            # traceback to stderr on the event loop for every dropped record
+            LOG_RECORDS_DROPPED.inc()
+
+
+def configure_logging() -> QueueListener:
+    """
+    Route log output through a stdlib queue so the event loop never blocks on log I/O.
+
+    Rendered events are handed to a QueueHandler, and a background
+    QueueListener thread writes them to stdout. When the queue is full,
+    records are dropped and counted in LOG_RECORDS_DROPPED.
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.handlers = [_DroppingQueueHandler(log_queue)]
+    root.setLevel(LOG_LEVEL)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
 
 
 # =============================================================================
 # Metrics
 # =============================================================================
 
+LOG_RECORDS_DROPPED = Counter(
+    'cortex_activator_log_records_dropped_total',
+    'Log records dropped because the log queue was full'
+)
+
 QUERIES_TOTAL = Counter(
     'cortex_activator_queries_total',
     'Total queries received',
@@ -169,17 +251,53 @@ ESCALATIONS = Counter(
     ['reason']  # low_confidence, previous_failure, etc.
 )
 
+# QUERIES_TOTAL increments are coalesced per (route_type, layer) and applied
+# in one pass every QUERY_COUNT_FLUSH_INTERVAL seconds
+QUERY_COUNT_FLUSH_INTERVAL = 0.01
+_pending_query_counts: defaultdict[tuple[str, str], int] = defaultdict(int)
+
+
+def flush_query_counts() -> None:
+    """Apply coalesced query counts to QUERIES_TOTAL."""
+    if not _pending_query_counts:
+        return
+    for (route_type, layer), count in _pending_query_counts.items():
+        QUERIES_TOTAL.labels(route_type=route_type, layer=layer).inc(count)
+    _pending_query_counts.clear()
+
+
+async def _query_count_flush_loop() -> None:
+    """Periodically flush coalesced query counts."""
+    while True:
+        await asyncio.sleep(QUERY_COUNT_FLUSH_INTERVAL)
+        flush_query_counts()
+
 
 # =============================================================================
 # Models
 # =============================================================================
 
 class QueryRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     query: str
     context: Optional[dict] = None
     site: str = "default"
 
 
+@dataclass(slots=True)
+class _InternalQuery:
+    """
+    Unvalidated query from a trusted internal caller (Cortex Redis Streams).
+
+    Exposes the same attributes process_query_internal() reads from
+    QueryRequest, without paying for Pydantic validation.
+    """
+    query: str
+    site: str = "default"
+    context: Optional[dict] = None
+
+
 class QueryResponse(BaseModel):
     success: bool
     result: Optional[dict] = None
@@ -233,7 +351,6 @@ class LayerManager:
             name: LayerState.COLD for name in layers
         }
         self.http = httpx.AsyncClient(timeout=5.0)
-        self.log = structlog.get_logger()
     
     async def check_health(self, layer_name: str) -> LayerState:
         """Check if a layer is healthy."""
@@ -276,7 +393,7 @@ class LayerManager:
                 if state == LayerState.WARM:
                     duration = time.time() - start
                     COLD_START_DURATION.labels(layer=layer_name).observe(duration)
-                    self.log.info(
+                    log.info(
                         "layer_ready",
                         layer=layer_name,
                         duration_seconds=round(duration, 2)
@@ -284,7 +401,7 @@ class LayerManager:
                     return True
                 await asyncio.sleep(poll_interval)
             
-            self.log.warning("layer_timeout", layer=layer_name, timeout=timeout)
+            log.warning("layer_timeout", layer=layer_name, timeout=timeout)
             return False
         finally:
             PENDING_REQUESTS.labels(layer=layer_name).dec()
@@ -307,37 +424,57 @@ class LayerManager:
 # Query Router
 # =============================================================================
 
+# Complexity keywords that require LLM reasoning (single case-insensitive scan)
+_NEEDS_REASONING_RE = re.compile(
+    r"why|investigate|analyze|figure out|what'?s wrong|troubleshoot|explain|help me understand",
+    re.IGNORECASE,
+)
+
+
 class QueryRouter:
     """Routes queries to appropriate layers based on content."""
     
     def __init__(self, rules: list[RoutingRule]):
-        self.rules = rules
-        self.log = structlog.get_logger()
-    
+        self.rules = tuple(rules)
+        # All rules fused into one alternation with a named group per rule.
+        # Each branch is anchored at the start with a lazy (?s:.*?) prefix, so
+        # the first rule matching anywhere in the query wins - the same
+        # semantics as searching every rule in order, in a single scan.
+        self._combined = RoutingRule._build_regex(
+            "|".join(
+                f"(?P<r{i}>(?s:.*?)(?:{rule.pattern}))"
+                for i, rule in enumerate(self.rules)
+            )
+        )
+        # Chat-activator retries resend identical queries; memoize the winner
+        self._classify_cached = lru_cache(maxsize=1024)(self._match_index)
+
+    def _match_index(self, query: str) -> int:
+        """Index of the first rule matching the query, or -1."""
+        match = self._combined.match(query)
+        if not match:
+            return -1
+        return int(match.lastgroup[1:])
+
     def classify(self, query: str) -> Optional[RoutingRule]:
         """Find matching routing rule for a query."""
-        query_lower = query.lower()
-        
-        for rule in self.rules:
-            if rule.compiled and rule.compiled.search(query_lower):
-                self.log.debug(
-                    "route_matched",
-                    query=query[:50],
-                    pattern=rule.pattern,
-                    tool=rule.tool
-                )
-                return rule
-        
-        return None
+        index = self._classify_cached(query)
+        if index < 0:
+            return None
+
+        rule = self.rules[index]
+        if LOG_LEVEL <= logging.DEBUG and random.random() < ROUTE_LOG_SAMPLE_RATE:
+            log.debug(
+                "route_matched",
+                query=query[:50],
+                pattern=rule.pattern,
+                tool=rule.tool
+            )
+        return rule
     
     def needs_reasoning(self, query: str) -> bool:
         """Check if query requires LLM reasoning."""
-        complexity_keywords = [
-            "why", "investigate", "analyze", "figure out",
-            "what's wrong", "troubleshoot", "explain", "help me understand"
-        ]
-        query_lower = query.lower()
-        return any(kw in query_lower for kw in complexity_keywords)
+        return _NEEDS_REASONING_RE.search(query) is not None
 
 
 # =============================================================================
@@ -362,26 +499,27 @@ async def handle_cortex_task(message: CortexMessage) -> dict:
     Translates Cortex message format to internal query format
     and processes via the same routing logic as HTTP requests.
     """
-    start = time.time()
+    start = time.perf_counter_ns()
 
     # Extract query from Cortex message payload
     query = message.payload.get("query", "")
     site = message.payload.get("site", "default")
     context = message.payload.get("context", {})
+    query_preview = query[:100]
 
     log.info(
         "cortex_task_processing",
         task_type=message.task_type,
-        query=query[:100]
+        query=query_preview
     )
 
-    # Create internal request
-    request = QueryRequest(query=query, site=site, context=context)
+    # Create internal request (trusted boundary - skip Pydantic validation)
+    request = _InternalQuery(query=query, site=site, context=context)
 
     # Process using existing routing logic
-    response = await process_query_internal(request)
+    response = await process_query_internal(request, query_preview=query_preview)
 
-    latency_ms = int((time.time() - start) * 1000)
+    latency_ms = (time.perf_counter_ns() - start) // 1_000_000
 
     return {
         "success": response.success,
@@ -397,12 +535,35 @@ async def handle_cortex_task(message: CortexMessage) -> dict:
 # FastAPI Application
 # =============================================================================
 
+class _ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that hands endpoints an orjson-decoding request."""
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            return await original_handler(_ORJSONRequest(request.scope, request.receive))
+
+        return handler
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     global cortex_client, qdrant_learning
 
+    log_listener = configure_logging()
     log.info("activator_starting", cortex_enabled=CORTEX_ENABLED, learning_enabled=LEARNING_ENABLED)
+    query_count_flusher = asyncio.create_task(_query_count_flush_loop())
 
     # Initialize Qdrant learning layer
     if LEARNING_ENABLED:
@@ -412,12 +573,21 @@ async def lifespan(app: FastAPI):
             log.info("qdrant_learning_active", url=qdrant_config.url)
         else:
             log.warning("qdrant_learning_failed_to_initialize")
+            # Release the embedding model/pool, gRPC channel and HTTP client
+            await qdrant_learning.close()
             qdrant_learning = None
 
-    # Check initial layer states
-    for layer_name in LAYERS:
-        state = await layer_manager.check_health(layer_name)
-        log.info("layer_initial_state", layer=layer_name, state=state.value)
+    # Pooled clients for layer calls, one per timeout tier, reused across queries
+    layer_limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    app.state.exec_http = httpx.AsyncClient(timeout=30.0, limits=layer_limits)
+    app.state.reasoning_http = httpx.AsyncClient(timeout=60.0, limits=layer_limits)
+
+    # Check initial layer states (probed concurrently)
+    states = await asyncio.gather(*(layer_manager.check_health(n) for n in LAYERS))
+    log.info(
+        "layer_initial_states",
+        states=dict(zip(LAYERS, (s.value for s in states))),
+    )
 
     # Start Cortex integration if enabled
     if CORTEX_ENABLED:
@@ -441,8 +611,15 @@ async def lifespan(app: FastAPI):
     if qdrant_learning:
         await qdrant_learning.close()
 
+    await app.state.exec_http.aclose()
+    await app.state.reasoning_http.aclose()
     await layer_manager.http.aclose()
+
+    query_count_flusher.cancel()
+    await asyncio.gather(query_count_flusher, return_exceptions=True)
+    flush_query_counts()
     log.info("activator_shutdown_complete")
+    log_listener.stop()
 
 
 app = FastAPI(
@@ -450,7 +627,9 @@ app = FastAPI(
     description="Query router and layer orchestrator for UniFi Layer Fabric",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
+app.router.route_class = ORJSONRoute
 
 # These would be loaded from config in production
 LAYERS = {
@@ -499,17 +678,28 @@ ROUTING_RULES = [
 
 layer_manager = LayerManager(LAYERS)
 query_router = QueryRouter(ROUTING_RULES)
-log = structlog.get_logger()
 
 
 # =============================================================================
 # Core Query Processing (used by both HTTP and Cortex)
 # =============================================================================
 
-async def process_query_internal(request: QueryRequest) -> QueryResponse:
+# Layer request bodies are pre-serialized with orjson and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upper bound on a buffered reasoning-layer reply (max_tokens=500 is far below this)
+REASONING_MAX_RESPONSE_BYTES = 1024 * 1024
+
+
+async def process_query_internal(
+    request: QueryRequest | _InternalQuery,
+    query_preview: Optional[str] = None,
+) -> QueryResponse:
     """
     Core query processing logic with learning-enabled routing cascade and mode switching.
 
+    query_preview is the log-truncated query when the caller already built it.
+
     Phase 4 Integration:
         - Query complexity scoring determines routing approach
         - Mode detection (LLM/Agent/Hybrid) guides execution
@@ -523,7 +713,7 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
 
     After execution, stores routing decision and outcome for learning.
     """
-    start = time.time()
+    start = time.perf_counter_ns()
     cold_starts = []
     layers_activated = []
     query_id = generate_query_id()
@@ -531,6 +721,7 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
     route_confidence = 0.0
     tool_selected = None
     exec_layer = None
+    qlog = log.bind(query_id=query_id)
 
     # Phase 4: Analyze query complexity and determine mode
     similar_success_rate = None
@@ -550,10 +741,9 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
     if mode_decision.escalation_reason:
         ESCALATIONS.labels(reason=mode_decision.escalation_reason.value).inc()
 
-    log.info(
+    qlog.info(
         "query_processing",
-        query=request.query[:100],
-        query_id=query_id,
+        query=query_preview if query_preview is not None else request.query[:100],
         mode=mode_decision.mode.value,
         complexity=mode_decision.complexity.level.value,
         complexity_score=mode_decision.complexity.score
@@ -570,18 +760,18 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
         tool_selected = rule.tool
         exec_layer = f"execution-unifi-{rule.execution}"
 
-        QUERIES_TOTAL.labels(route_type="keyword", layer=exec_layer).inc()
-        log.debug("route_tier1_keyword", tool=tool_selected, layer=exec_layer)
+        _pending_query_counts[("keyword", exec_layer)] += 1
+        qlog.debug("route_tier1_keyword", tool=tool_selected, layer=exec_layer)
 
     # =========================================================================
     # TIER 2: Qdrant Similarity Search (<50ms) - Skip LLM if similar past success
     # =========================================================================
     if not rule and qdrant_learning:
-        similarity_start = time.time()
+        similarity_start = time.perf_counter_ns()
         try:
             similar = await qdrant_learning.find_similar_route(request.query)
-            similarity_latency = time.time() - similarity_start
-            SIMILARITY_LATENCY.observe(similarity_latency)
+            similarity_ns = time.perf_counter_ns() - similarity_start
+            SIMILARITY_LATENCY.observe(similarity_ns / 1e9)
 
             if similar:
                 SIMILARITY_LOOKUPS.labels(result="hit").inc()
@@ -590,20 +780,20 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
                 tool_selected = similar.tool
                 exec_layer = similar.execution_layer
 
-                QUERIES_TOTAL.labels(route_type="similarity", layer=exec_layer).inc()
-                log.info(
+                _pending_query_counts[("similarity", exec_layer)] += 1
+                qlog.info(
                     "route_tier2_similarity",
                     tool=tool_selected,
                     layer=exec_layer,
                     similarity=round(similar.similarity, 3),
                     success_rate=round(similar.success_rate, 2),
-                    latency_ms=round(similarity_latency * 1000, 1)
+                    latency_ms=round(similarity_ns / 1e6, 1)
                 )
             else:
                 SIMILARITY_LOOKUPS.labels(result="miss").inc()
         except Exception as e:
             SIMILARITY_LOOKUPS.labels(result="error").inc()
-            log.warning("similarity_lookup_error", error=str(e))
+            qlog.warning("similarity_lookup_error", error=str(e))
 
     # =========================================================================
     # TIER 3/4: Reasoning Layers (if no keyword or similarity match)
@@ -618,8 +808,8 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
             route_type = RouteType.CLASSIFIER
 
         exec_layer = reasoning_layer
-        QUERIES_TOTAL.labels(route_type=route_type.value, layer=reasoning_layer).inc()
-        log.debug("route_tier3_4_reasoning", layer=reasoning_layer)
+        _pending_query_counts[(route_type.value, reasoning_layer)] += 1
+        qlog.debug("route_tier3_4_reasoning", layer=reasoning_layer)
 
     # =========================================================================
     # STORE ROUTING DECISION (before execution)
@@ -646,7 +836,7 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
             await qdrant_learning.store_routing(decision)
             ROUTING_STORED.labels(route_type=route_type.value).inc()
         except Exception as e:
-            log.warning("store_routing_failed", error=str(e))
+            qlog.warning("store_routing_failed", error=str(e))
 
     # =========================================================================
     # EXECUTE: Wake layer and run
@@ -654,7 +844,7 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
 
     # Wake execution layer if needed
     if not await layer_manager.ensure_ready(exec_layer):
-        latency_ms = int((time.time() - start) * 1000)
+        latency_ms = (time.perf_counter_ns() - start) // 1_000_000
         # Store failed outcome
         await _store_outcome(query_id, False, latency_ms, "layer_unavailable")
         return QueryResponse(
@@ -684,46 +874,55 @@ async def process_query_internal(request: QueryRequest) -> QueryResponse:
     try:
         if exec_layer.startswith("execution-unifi-"):
             # Direct execution layer
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(
-                    f"{LAYERS[exec_layer].endpoint}/execute",
-                    json={
-                        "tool": tool_selected or "unknown",
-                        "query": request.query,
-                        "site": request.site,
-                        "context": request.context
-                    }
-                )
-                result = resp.json()
-                success = resp.status_code == 200
+            resp = await app.state.exec_http.post(
+                f"{LAYERS[exec_layer].endpoint}/execute",
+                content=orjson.dumps({
+                    "tool": tool_selected or "unknown",
+                    "query": request.query,
+                    "site": request.site,
+                    "context": request.context
+                }),
+                headers=_JSON_HEADERS,
+            )
+            result = orjson.loads(resp.content)
+            success = resp.status_code == 200
         else:
-            # Reasoning layer
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                resp = await client.post(
-                    f"{LAYERS[exec_layer].endpoint}/v1/chat/completions",
-                    json={
-                        "messages": [
-                            {"role": "user", "content": request.query}
-                        ],
-                        "temperature": 0.1,
-                        "max_tokens": 500
-                    }
-                )
-                reasoning_result = resp.json()
-                result = {"message": "Query processed via reasoning layer", "reasoning": reasoning_result}
-                success = True
-                # TODO: Parse tool call from response and execute
+            # Reasoning layer: stream into one bounded buffer, parse only on 200
+            async with app.state.reasoning_http.stream(
+                "POST",
+                f"{LAYERS[exec_layer].endpoint}/v1/chat/completions",
+                content=orjson.dumps({
+                    "messages": [
+                        {"role": "user", "content": request.query}
+                    ],
+                    "temperature": 0.1,
+                    "max_tokens": 500
+                }),
+                headers=_JSON_HEADERS,
+            ) as resp:
+                if resp.status_code != 200:
+                    error = f"reasoning layer returned HTTP {resp.status_code}"
+                else:
+                    body = bytearray()
+                    async for chunk in resp.aiter_bytes():
+                        body += chunk
+                        if len(body) > REASONING_MAX_RESPONSE_BYTES:
+                            raise ValueError("reasoning layer response too large")
+                    reasoning_result = orjson.loads(body)
+                    result = {"message": "Query processed via reasoning layer", "reasoning": reasoning_result}
+                    success = True
+                    # TODO: Parse tool call from response and execute
 
     except Exception as e:
-        log.error("execution_failed", layer=exec_layer, error=str(e))
+        qlog.error("execution_failed", layer=exec_layer, error=str(e))
         error = str(e)
 
         # Failover to SSH if API fails
         if exec_layer == "execution-unifi-api":
-            log.info("failover_to_ssh", original_layer=exec_layer)
+            qlog.info("failover_to_ssh", original_layer=exec_layer)
             # TODO: Implement SSH failover
 
-    latency_ms = int((time.time() - start) * 1000)
+    latency_ms = (time.perf_counter_ns() - start) // 1_000_000
 
     # =========================================================================
     # STORE OUTCOME (for learning)
@@ -805,19 +1004,29 @@ async def ready():
     return status
 
 
+# Rendered exposition is reused for 1s so concurrent scrapers share one registry walk
+METRICS_CACHE_TTL = 1.0
+_metrics_body = b""
+_metrics_rendered_at = float("-inf")
+
+
 @app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint."""
-    return generate_latest()
+    global _metrics_body, _metrics_rendered_at
+    now = time.monotonic()
+    if now - _metrics_rendered_at > METRICS_CACHE_TTL:
+        flush_query_counts()
+        _metrics_body = generate_latest()
+        _metrics_rendered_at = now
+    return Response(content=_metrics_body, media_type=CONTENT_TYPE_LATEST)
 
 
 @app.get("/status")
 async def status():
     """Detailed status of all layers and Cortex integration."""
-    layer_states = {}
-    for layer_name in LAYERS:
-        state = await layer_manager.check_health(layer_name)
-        layer_states[layer_name] = state.value
+    states = await asyncio.gather(*(layer_manager.check_health(n) for n in LAYERS))
+    layer_states = dict(zip(LAYERS, (s.value for s in states)))
 
     response = {
         "activator": "running",
@@ -844,7 +1053,6 @@ async def handle_query(request: QueryRequest):
     This is the direct HTTP interface - same logic is also
     available via Cortex Redis Streams when CORTEX_ENABLED=true.
     """
-    log.info("http_query_received", query=request.query[:100])
     return await process_query_internal(request)
 
 
@@ -994,4 +1202,4 @@ async def analyze_query_endpoint(request: AnalyzeRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop")
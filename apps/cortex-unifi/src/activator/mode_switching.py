@@ -24,8 +24,10 @@ Auto-Escalation Triggers:
     - Timeout or failure in simpler mode
 """
 
+import bisect
 import re
-from dataclasses import dataclass
+from functools import lru_cache
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Optional, List, Tuple
 
@@ -68,16 +70,21 @@ class EscalationReason(str, Enum):
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplexityScore:
-    """Result of complexity analysis."""
+    """Result of complexity analysis (immutable: instances are shared via cache)."""
     score: int  # 0-100
     level: ComplexityLevel
-    factors: dict[str, int]  # Individual factor scores
+    factor_items: Tuple[Tuple[str, int], ...]  # Individual factor scores
     reasoning: str
 
+    @property
+    def factors(self) -> dict[str, int]:
+        """Individual factor scores, as a fresh dict the caller may modify."""
+        return dict(self.factor_items)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ModeDecision:
     """Result of mode detection."""
     mode: QueryMode
@@ -91,29 +98,43 @@ class ModeDecision:
 # Complexity Scoring
 # =============================================================================
 
-# Complexity indicators with weights
+# Complexity indicators with weights (compiled once, matched case-insensitively)
 COMPLEXITY_PATTERNS = {
-    # High complexity (add 15-25 points)
-    "investigate": (r"\b(investigate|figure out|find out why)\b", 20),
-    "analyze": (r"\b(analyze|examine|assess|evaluate)\b", 18),
-    "troubleshoot": (r"\b(troubleshoot|debug|diagnose|fix)\b", 22),
-    "explain_why": (r"\b(explain why|why (is|are|does|do|did|was))\b", 15),
-    "multi_step": (r"\b(first.*then|after.*do|step by step)\b", 18),
-    "compare": (r"\b(compare|difference between|versus|vs\.?)\b", 15),
-
-    # Moderate complexity (add 8-14 points)
-    "what_is": (r"\b(what (is|are|was|were))\b", 8),
-    "how_to": (r"\b(how (to|do|can|should))\b", 10),
-    "configure": (r"\b(configure|setup|set up|enable|disable)\b", 12),
-    "multiple_items": (r"\b(all|every|each|multiple|several)\b", 10),
-    "conditional": (r"\b(if|when|unless|only when)\b", 12),
-
-    # Low complexity indicators (negative points)
-    "list_show": (r"\b(list|show|get|display)\b", -5),
-    "simple_action": (r"\b(restart|reboot|block|unblock)\b", -8),
-    "status_check": (r"\b(status|health|check if)\b", -5),
+    name: (re.compile(pattern, re.IGNORECASE), weight)
+    for name, (pattern, weight) in {
+        # High complexity (add 15-25 points)
+        "investigate": (r"\b(investigate|figure out|find out why)\b", 20),
+        "analyze": (r"\b(analyze|examine|assess|evaluate)\b", 18),
+        "troubleshoot": (r"\b(troubleshoot|debug|diagnose|fix)\b", 22),
+        "explain_why": (r"\b(explain why|why (is|are|does|do|did|was))\b", 15),
+        "multi_step": (r"\b(first.*then|after.*do|step by step)\b", 18),
+        "compare": (r"\b(compare|difference between|versus|vs\.?)\b", 15),
+
+        # Moderate complexity (add 8-14 points)
+        "what_is": (r"\b(what (is|are|was|were))\b", 8),
+        "how_to": (r"\b(how (to|do|can|should))\b", 10),
+        "configure": (r"\b(configure|setup|set up|enable|disable)\b", 12),
+        "multiple_items": (r"\b(all|every|each|multiple|several)\b", 10),
+        "conditional": (r"\b(if|when|unless|only when)\b", 12),
+
+        # Low complexity indicators (negative points)
+        "list_show": (r"\b(list|show|get|display)\b", -5),
+        "simple_action": (r"\b(restart|reboot|block|unblock)\b", -8),
+        "status_check": (r"\b(status|health|check if)\b", -5),
+    }.items()
 }
 
+# Entity patterns (devices, clients, networks, etc.) and question marks,
+# fused into one scan
+_ENTITIES_RE = re.compile(
+    r"(?P<mac>\b[0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2})"  # MAC addresses
+    r"|(?P<ip>\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b)"  # IP addresses
+    r"|(?P<vlan>\bvlan[- ]?\d+\b)"  # VLANs
+    r"|(?P<dev>\b[a-z]+-[a-z]+-\d+\b)"  # Device names like ap-office-01
+    r"|(?P<q>\?)",  # Questions
+    re.IGNORECASE,
+)
+
 # Length-based complexity
 LENGTH_SCORES = [
     (20, -10),    # Very short queries are likely simple
@@ -123,6 +144,26 @@ LENGTH_SCORES = [
     (500, 15),    # Long queries more complex
     (1000, 25),   # Very long queries likely complex
 ]
+_LEN_THRESH = tuple(threshold for threshold, _ in LENGTH_SCORES)
+_LEN_ADJ = tuple(adjustment for _, adjustment in LENGTH_SCORES) + (30,)  # Very long queries
+
+# Fast lane for short single-verb operational queries ("restart ap-lab-3").
+# Skipped whenever any complexity-raising indicator is present, including
+# the more-than-two-entities bonus.
+_SIMPLE_FAST_RE = re.compile(
+    r"^\s*(list|show|get|display|restart|reboot|status|health)\b[\w\s\-]{0,30}$",
+    re.IGNORECASE,
+)
+_ESCALATING_RE = re.compile(
+    "|".join(rx.pattern for rx, weight in COMPLEXITY_PATTERNS.values() if weight > 0),
+    re.IGNORECASE,
+)
+_SIMPLE_SCORE = ComplexityScore(
+    score=10,
+    level=ComplexityLevel.SIMPLE,
+    factor_items=(("fast_path", -40),),
+    reasoning="Score 10 (simple): fast_path(-40)",
+)
 
 
 def score_complexity(query: str, context: Optional[dict] = None) -> ComplexityScore:
@@ -136,53 +177,66 @@ def score_complexity(query: str, context: Optional[dict] = None) -> ComplexitySc
     - Question count
     - Entity/number count
     """
+    # Context only contributes through its size band, so that is the cache key
+    context_bucket = 0
+    if context:
+        context_size = len(str(context))
+        if context_size > 2000:
+            context_bucket = 2
+        elif context_size > 500:
+            context_bucket = 1
+    if (
+        context_bucket == 0
+        and len(query) < 40
+        and _SIMPLE_FAST_RE.match(query)
+        and not _ESCALATING_RE.search(query)
+        and len(_ENTITIES_RE.findall(query)) <= 2
+    ):
+        return _SIMPLE_SCORE
+    return _score_complexity_cached(query, context_bucket)
+
+
+@lru_cache(maxsize=2048)
+def _score_complexity_cached(query: str, context_bucket: int) -> ComplexityScore:
+    """Score a query given its context size band (0: <=500, 1: <=2000, 2: larger)."""
     score = 50  # Start at baseline
     factors = {}
-    query_lower = query.lower()
 
     # Pattern-based scoring
-    for name, (pattern, weight) in COMPLEXITY_PATTERNS.items():
-        if re.search(pattern, query_lower):
+    for name, (rx, weight) in COMPLEXITY_PATTERNS.items():
+        if rx.search(query):
             factors[name] = weight
             score += weight
 
     # Length-based scoring
-    length = len(query)
-    length_adjustment = 0
-    for threshold, adjustment in LENGTH_SCORES:
-        if length <= threshold:
-            length_adjustment = adjustment
-            break
-    else:
-        length_adjustment = 30  # Very long queries
+    length_adjustment = _LEN_ADJ[bisect.bisect_left(_LEN_THRESH, len(query))]
     factors["length"] = length_adjustment
     score += length_adjustment
 
+    # Questions and entities are tallied in the same pass
+    question_count = 0
+    entity_count = 0
+    for match in _ENTITIES_RE.finditer(query):
+        if match.lastgroup == "q":
+            question_count += 1
+        else:
+            entity_count += 1
+
     # Question count (multiple questions = more complex)
-    question_count = query.count("?")
     if question_count > 1:
         question_adjustment = (question_count - 1) * 8
         factors["questions"] = question_adjustment
         score += question_adjustment
 
     # Context complexity
-    if context:
-        context_size = len(str(context))
-        if context_size > 500:
-            factors["context"] = 10
-            score += 10
-        if context_size > 2000:
-            factors["context"] = 20
-            score += 10  # Additional 10
+    if context_bucket >= 1:
+        factors["context"] = 10
+        score += 10
+    if context_bucket >= 2:
+        factors["context"] = 20
+        score += 10  # Additional 10
 
     # Number of entities mentioned (devices, clients, networks, etc.)
-    entity_patterns = [
-        r"\b[0-9a-fA-F]{2}:[0-9a-fA-F]{2}:[0-9a-fA-F]{2}",  # MAC addresses
-        r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b",  # IP addresses
-        r"\bvlan[- ]?\d+\b",  # VLANs
-        r"\b[a-z]+-[a-z]+-\d+\b",  # Device names like ap-office-01
-    ]
-    entity_count = sum(len(re.findall(p, query_lower)) for p in entity_patterns)
     if entity_count > 2:
         factors["entities"] = entity_count * 3
         score += entity_count * 3
@@ -208,7 +262,7 @@ def score_complexity(query: str, context: Optional[dict] = None) -> ComplexitySc
     return ComplexityScore(
         score=score,
         level=level,
-        factors=factors,
+        factor_items=tuple(factors.items()),
         reasoning=reasoning
     )
 
@@ -234,6 +288,9 @@ LLM_PATTERNS = [
     r"\b(summarize|summary of)\b",
 ]
 
+_AGENT_RES = tuple(re.compile(p, re.IGNORECASE) for p in AGENT_PATTERNS)
+_LLM_RES = tuple(re.compile(p, re.IGNORECASE) for p in LLM_PATTERNS)
+
 
 def detect_mode(
     query: str,
@@ -250,13 +307,12 @@ def detect_mode(
     - Previous routing confidence
     - Previous execution success
     """
-    query_lower = query.lower()
     confidence = 0.8  # Start with reasonable confidence
     escalation_reason = None
 
     # Check for agent indicators
-    is_agent_query = any(re.search(p, query_lower) for p in AGENT_PATTERNS)
-    is_llm_query = any(re.search(p, query_lower) for p in LLM_PATTERNS)
+    is_agent_query = any(rx.search(query) for rx in _AGENT_RES)
+    is_llm_query = any(rx.search(query) for rx in _LLM_RES)
 
     # Base mode decision
     if is_agent_query and is_llm_query:
@@ -334,7 +390,7 @@ def detect_mode(
 # Auto-Escalation Logic
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EscalationContext:
     """Context for escalation decision."""
     query: str
@@ -421,14 +477,12 @@ def analyze_query(
     # Additional escalation check based on similar query success rate
     if similar_success_rate is not None and similar_success_rate < 0.6:
         # Lower confidence and potentially escalate
-        decision.confidence = max(0.3, decision.confidence - 0.2)
+        decision = replace(decision, confidence=max(0.3, decision.confidence - 0.2))
         if decision.mode == QueryMode.AGENT and similar_success_rate < 0.4:
-            decision = ModeDecision(
+            decision = replace(
+                decision,
                 mode=QueryMode.HYBRID,
-                complexity=decision.complexity,
-                confidence=decision.confidence,
                 escalation_reason=EscalationReason.PREVIOUS_FAILURE,
-                recommended_model=decision.recommended_model
             )
 
     log.debug(
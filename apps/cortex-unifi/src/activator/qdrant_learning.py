@@ -14,7 +14,9 @@ Architecture:
 
 Collections:
     - routing_queries: Query embeddings with routing decisions
+      (near-duplicate queries share one running-mean centroid point)
     - routing_outcomes: Links query to execution outcome for learning
+      (payload-only, indexed by query_id)
 
 Embedding Model: all-MiniLM-L6-v2 (384 dimensions)
     - Fast inference (~5ms per query)
@@ -23,19 +25,29 @@ Embedding Model: all-MiniLM-L6-v2 (384 dimensions)
 """
 
 import asyncio
+import hashlib
 import os
 import time
 import uuid
-from dataclasses import dataclass, field
-from datetime import datetime
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import numpy as np
+import orjson
 import structlog
+from qdrant_client import AsyncQdrantClient, models
 
 log = structlog.get_logger()
 
+# REST bodies are pre-serialized with orjson (vectors straight from numpy)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 # =============================================================================
 # Configuration
@@ -45,6 +57,7 @@ log = structlog.get_logger()
 class QdrantConfig:
     """Configuration for Qdrant learning layer."""
     url: str = "http://unifi-cortex-qdrant.cortex-unifi:6333"
+    grpc_port: int = 6334  # Similarity searches go over gRPC; writes stay on REST
     collection_queries: str = "routing_queries"
     collection_outcomes: str = "routing_outcomes"
 
@@ -59,19 +72,56 @@ class QdrantConfig:
     # Embedding service (if using external)
     embedding_url: Optional[str] = None  # If None, use local model
 
+    # Local model runtime: "onnx" (ONNX Runtime, falls back to torch) or "torch"
+    embedding_backend: str = "onnx"
+    embedding_onnx_file: Optional[str] = None  # e.g. onnx/model_qint8_avx512_vnni.onnx
+    embedding_cache_dir: Optional[str] = None  # Pre-downloaded model files (default: HF cache)
+
+    # Concurrent local embed() calls are coalesced into one model.encode batch
+    embed_batch_size: int = 32
+    embed_batch_window_ms: int = 5
+
+    # Near-duplicate routings merge into one centroid point (>1.0 disables)
+    centroid_threshold: float = 0.86
+    centroid_max_members: int = 32  # member_query_ids kept per centroid for auditing
+
+    # Outcome stats are accumulated in-process and written back in batches
+    stats_flush_interval_s: float = 1.0
+    stats_flush_size: int = 100  # Flush early once this many routings are dirty
+
+    # In-process cache of recent similarity hits (0 disables)
+    query_cache_size: int = 4096
+    query_cache_ttl_s: float = 300.0
+
     @classmethod
     def from_env(cls) -> "QdrantConfig":
         """Load configuration from environment."""
         return cls(
             url=os.getenv("QDRANT_URL", "http://unifi-cortex-qdrant.cortex-unifi:6333"),
+            grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
             collection_queries=os.getenv("QDRANT_COLLECTION_QUERIES", "routing_queries"),
             collection_outcomes=os.getenv("QDRANT_COLLECTION_OUTCOMES", "routing_outcomes"),
             similarity_threshold=float(os.getenv("SIMILARITY_THRESHOLD", "0.92")),
             confidence_threshold=float(os.getenv("CONFIDENCE_THRESHOLD", "0.85")),
             embedding_url=os.getenv("EMBEDDING_SERVICE_URL"),
+            embedding_backend=os.getenv("EMBEDDING_BACKEND", "onnx"),
+            embedding_onnx_file=os.getenv("EMBEDDING_ONNX_FILE"),
+            embedding_cache_dir=os.getenv("EMBEDDING_CACHE_DIR"),
+            embed_batch_size=int(os.getenv("EMBED_BATCH_SIZE", "32")),
+            embed_batch_window_ms=int(os.getenv("EMBED_BATCH_WINDOW_MS", "5")),
+            centroid_threshold=float(os.getenv("CENTROID_MERGE_THRESHOLD", "0.86")),
+            stats_flush_interval_s=float(os.getenv("STATS_FLUSH_INTERVAL_SECONDS", "1.0")),
+            stats_flush_size=int(os.getenv("STATS_FLUSH_SIZE", "100")),
+            query_cache_size=int(os.getenv("QUERY_CACHE_SIZE", "4096")),
+            query_cache_ttl_s=float(os.getenv("QUERY_CACHE_TTL_SECONDS", "300")),
         )
 
 
+def _now_ms() -> int:
+    """Current time in milliseconds since the epoch (payload timestamps)."""
+    return time.time_ns() // 1_000_000
+
+
 class RouteType(str, Enum):
     """How a query was routed."""
     CACHE = "cache"          # Exact cache hit
@@ -86,12 +136,12 @@ class RoutingDecision:
     """A routing decision to store/retrieve from Qdrant."""
     query_id: str
     query_text: str
-    query_embedding: List[float]
+    query_embedding: np.ndarray  # (dim,) float32
     route_type: RouteType
     tool: str
     execution_layer: str  # api, ssh, reasoning-classifier, reasoning-slm
     confidence: float
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: int = field(default_factory=_now_ms)  # Epoch milliseconds
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -105,7 +155,7 @@ class RoutingOutcome:
     error_type: Optional[str] = None  # timeout, tool_error, layer_unavailable
     result_summary: Optional[str] = None
     user_feedback: Optional[str] = None  # positive, negative
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: int = field(default_factory=_now_ms)  # Epoch milliseconds
 
 
 @dataclass
@@ -126,6 +176,21 @@ class SimilarRoute:
 # Embedding Client
 # =============================================================================
 
+# Routing embeds the same query twice (similarity lookup, then storage), and
+# chat retries resend it; recent model/service embeddings are kept per text
+EMBEDDING_CACHE_SIZE = 2048
+
+# Max in-flight requests to an external embedding service per embed_batch()
+REMOTE_EMBED_CONCURRENCY = 16
+
+
+@lru_cache(maxsize=2048)
+def _normalize(text: str) -> Tuple[bytes, bytes]:
+    """Lower-cased UTF-8 form of text and its SHA-384 digest."""
+    lower = text.lower().encode()
+    return lower, hashlib.sha384(lower).digest()
+
+
 class EmbeddingClient:
     """
     Client for generating query embeddings.
@@ -136,7 +201,20 @@ class EmbeddingClient:
     def __init__(self, config: QdrantConfig):
         self.config = config
         self._model = None
-        self._http = httpx.AsyncClient(timeout=10.0)
+        # Only the remote path makes HTTP calls
+        self._http = (
+            httpx.AsyncClient(base_url=config.embedding_url, timeout=10.0)
+            if config.embedding_url
+            else None
+        )
+        # Local encodes run on a dedicated pool, capped so concurrent callers
+        # don't multiply torch's intra-op threads
+        self._embed_sem: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # (text, future) pairs waiting for the next local encode batch
+        self._batch_queue: asyncio.Queue = asyncio.Queue()
+        self._batch_task: Optional[asyncio.Task] = None
+        self._recent: OrderedDict[str, np.ndarray] = OrderedDict()
 
     async def initialize(self) -> None:
         """Initialize the embedding model."""
@@ -146,14 +224,50 @@ class EmbeddingClient:
             # Lazy load sentence-transformers to avoid startup delay
             try:
                 from sentence_transformers import SentenceTransformer
-                self._model = SentenceTransformer('all-MiniLM-L6-v2')
-                log.info("embedding_client_local", model="all-MiniLM-L6-v2")
+                self._model, backend, device = self._load_model(SentenceTransformer)
+                max_concurrent = 1 if device == "cpu" else 4
+                self._embed_sem = asyncio.Semaphore(max_concurrent)
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_concurrent, thread_name_prefix="embed"
+                )
+                self._batch_task = asyncio.create_task(self._batch_loop())
+                log.info(
+                    "embedding_client_local",
+                    model="all-MiniLM-L6-v2",
+                    backend=backend,
+                    device=device,
+                    max_concurrent=max_concurrent
+                )
             except ImportError:
                 log.warning("sentence_transformers_not_available")
                 # Will fall back to simple hash-based pseudo-embeddings
 
-    async def embed(self, text: str) -> List[float]:
-        """Generate embedding for text."""
+    def _load_model(self, model_cls) -> Tuple[Any, str, str]:
+        """Load MiniLM on the configured backend; returns (model, backend, device type)."""
+        if self.config.embedding_backend == "onnx":
+            model_kwargs = {"provider": "CPUExecutionProvider"}
+            if self.config.embedding_onnx_file:
+                model_kwargs["file_name"] = self.config.embedding_onnx_file
+            try:
+                model = model_cls(
+                    'all-MiniLM-L6-v2',
+                    backend="onnx",
+                    model_kwargs=model_kwargs,
+                    cache_folder=self.config.embedding_cache_dir
+                )
+                return model, "onnx", "cpu"
+            except Exception as e:
+                log.warning("embedding_onnx_unavailable", error=str(e))
+
+        model = model_cls('all-MiniLM-L6-v2', cache_folder=self.config.embedding_cache_dir)
+        return model, "torch", model.device.type
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Generate a float32 embedding for text (read-only; may be shared)."""
+        cached = self._recent.get(text)
+        if cached is not None:
+            self._recent.move_to_end(text)
+            return cached
         if self.config.embedding_url:
             return await self._embed_remote(text)
         elif self._model:
@@ -161,67 +275,287 @@ class EmbeddingClient:
         else:
             return self._embed_fallback(text)
 
-    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts."""
+    async def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for multiple texts as one (len(texts), dim) array."""
         if self.config.embedding_url:
-            return [await self._embed_remote(t) for t in texts]
+            sem = asyncio.Semaphore(REMOTE_EMBED_CONCURRENCY)
+
+            async def embed_one(text: str) -> np.ndarray:
+                async with sem:
+                    return await self.embed(text)
+
+            return np.stack(await asyncio.gather(*(embed_one(t) for t in texts)))
         elif self._model:
-            return await self._embed_local_batch(texts)
+            return await self._encode(texts)
         else:
-            return [self._embed_fallback(t) for t in texts]
+            return np.stack([self._embed_fallback(t) for t in texts])
 
-    async def _embed_remote(self, text: str) -> List[float]:
+    async def _embed_remote(self, text: str) -> np.ndarray:
         """Get embedding from external service."""
         try:
             resp = await self._http.post(
-                f"{self.config.embedding_url}/embed",
-                json={"text": text}
+                "/embed",
+                content=orjson.dumps({"text": text}),
+                headers=_JSON_HEADERS
             )
             resp.raise_for_status()
-            return resp.json()["embedding"]
+            embedding = np.asarray(orjson.loads(resp.content)["embedding"], dtype=np.float32)
+            return self._remember(text, embedding)
         except Exception as e:
             log.error("embedding_remote_error", error=str(e))
             return self._embed_fallback(text)
 
-    async def _embed_local(self, text: str) -> List[float]:
-        """Get embedding from local model."""
-        loop = asyncio.get_event_loop()
-        embedding = await loop.run_in_executor(
-            None,
-            lambda: self._model.encode(text, convert_to_numpy=True).tolist()
-        )
+    async def _embed_local(self, text: str) -> np.ndarray:
+        """Get embedding from local model, batched with concurrent callers."""
+        future = asyncio.get_running_loop().create_future()
+        self._batch_queue.put_nowait((text, future))
+        return self._remember(text, await future)
+
+    def _remember(self, text: str, embedding: np.ndarray) -> np.ndarray:
+        """Keep a model/service embedding for repeat lookups (never fallback ones)."""
+        embedding.flags.writeable = False  # Handed out to every caller of embed()
+        self._recent[text] = embedding
+        if len(self._recent) > EMBEDDING_CACHE_SIZE:
+            self._recent.popitem(last=False)
         return embedding
 
-    async def _embed_local_batch(self, texts: List[str]) -> List[List[float]]:
-        """Get embeddings from local model in batch."""
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None,
-            lambda: self._model.encode(texts, convert_to_numpy=True).tolist()
-        )
+    async def _encode(self, texts: List[str]) -> np.ndarray:
+        """Run one model.encode over texts, shortest first to minimise padding."""
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+        loop = asyncio.get_running_loop()
+        async with self._embed_sem:
+            encoded = await loop.run_in_executor(
+                self._executor,
+                lambda: self._model.encode(
+                    sorted_texts,
+                    batch_size=self.config.embed_batch_size,
+                    convert_to_numpy=True
+                )
+            )
+        embeddings = np.empty(encoded.shape, dtype=np.float32)
+        embeddings[order] = encoded
         return embeddings
 
-    def _embed_fallback(self, text: str) -> List[float]:
+    async def _batch_loop(self) -> None:
+        """Drain queued embed() calls in size/time-bounded batches."""
+        loop = asyncio.get_running_loop()
+        window = self.config.embed_batch_window_ms / 1000
+
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + window
+
+            try:
+                while len(batch) < self.config.embed_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                embeddings = await self._encode([text for text, _ in batch])
+            except asyncio.CancelledError:
+                # close() mid-batch: callers awaiting these futures must not hang
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("embedding client closed"))
+                raise
+            except Exception as e:
+                log.error("embedding_batch_error", error=str(e), batch_size=len(batch))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    # Copy so a cached row doesn't pin the whole batch array
+                    future.set_result(embedding.copy())
+
+    def _embed_fallback(self, text: str) -> np.ndarray:
         """
         Fallback pseudo-embedding based on text hash.
         Not semantically meaningful, but allows basic deduplication.
         """
-        import hashlib
         # Create deterministic pseudo-random embedding from hash
-        h = hashlib.sha384(text.lower().encode()).digest()
-        # Convert bytes to floats in [-1, 1]
-        embedding = [(b - 128) / 128.0 for b in h]
-        return embedding
+        h = np.frombuffer(_normalize(text)[1], dtype=np.uint8)
+        # Convert bytes to floats in [-1, 1] (exact in float32: multiples of 1/128)
+        return (h.astype(np.float32) - 128.0) / 128.0
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self._http.aclose()
+        """Close HTTP client and embedding pool."""
+        if self._http:
+            await self._http.aclose()
+        if self._batch_task:
+            self._batch_task.cancel()
+            await asyncio.gather(self._batch_task, return_exceptions=True)
+            self._batch_task = None
+        while not self._batch_queue.empty():
+            _, future = self._batch_queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("embedding client closed"))
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# =============================================================================
+# Query Cache
+# =============================================================================
+
+class _QueryCache:
+    """
+    LRU of recent similarity hits, served without embedding or Qdrant.
+
+    Lookups first match the normalized query text by digest, then by cosine
+    similarity against a pool of the cached queries' embeddings. Entries
+    expire after ttl_s so success-rate changes in Qdrant are picked up.
+    """
+
+    def __init__(self, max_entries: int, ttl_s: float, threshold: float):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.threshold = threshold
+        # digest -> (pool row, route, inserted_at)
+        self._entries: OrderedDict[bytes, Tuple[int, SimilarRoute, float]] = OrderedDict()
+        self._pool: Optional[np.ndarray] = None  # (max_entries, dim) unit vectors
+        self._row_keys: List[Optional[bytes]] = []
+        self._free_rows: List[int] = []
+        self._rows_used = 0  # High-water mark; rows beyond it are never scored
+
+    @staticmethod
+    def key(query: str) -> bytes:
+        return _normalize(query.strip())[1]
+
+    def get(self, key: bytes) -> Optional[SimilarRoute]:
+        """Exact lookup by query digest."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[2] > self.ttl_s:
+            self._evict(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def get_similar(self, embedding: np.ndarray) -> Optional[Tuple[SimilarRoute, float]]:
+        """Nearest cached query by cosine similarity, if above threshold, with its insert time."""
+        if not self._entries or self._pool is None or embedding.shape[0] != self._pool.shape[1]:
+            return None
+        norm = np.linalg.norm(embedding)
+        if not norm:
+            return None
+        scores = self._pool[:self._rows_used] @ (embedding / norm)
+        row = int(np.argmax(scores))
+        score = float(scores[row])
+        if score < self.threshold:
+            return None
+        key = self._row_keys[row]
+        if key is None:
+            return None
+        _, route, inserted_at = self._entries[key]
+        if time.monotonic() - inserted_at > self.ttl_s:
+            self._evict(key)
+            return None
+        self._entries.move_to_end(key)
+        # Cached similarity was measured against the original query
+        return replace(route, similarity=min(route.similarity, score)), inserted_at
+
+    def put(
+        self,
+        key: bytes,
+        embedding: np.ndarray,
+        route: SimilarRoute,
+        inserted_at: Optional[float] = None,
+    ) -> None:
+        """
+        Cache a qualifying route, evicting the least recently used entry when full.
+
+        Pass the source entry's inserted_at when linking a near-duplicate so
+        the TTL still counts from the original Qdrant lookup.
+        """
+        if self._pool is None:
+            self._pool = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+            self._row_keys = [None] * self.max_entries
+            self._free_rows = list(range(self.max_entries - 1, -1, -1))
+        elif embedding.shape[0] != self._pool.shape[1]:
+            return
+        if key in self._entries:
+            self._evict(key)
+        elif not self._free_rows:
+            self._evict(next(iter(self._entries)))
+        row = self._free_rows.pop()
+        norm = np.linalg.norm(embedding)
+        self._pool[row] = embedding / norm if norm else 0.0
+        self._row_keys[row] = key
+        self._rows_used = max(self._rows_used, row + 1)
+        self._entries[key] = (row, route, inserted_at if inserted_at is not None else time.monotonic())
+
+    def evict_route(self, query_id: str) -> None:
+        """Drop every entry serving the given routing point."""
+        for key in [k for k, (_, route, _) in self._entries.items() if route.query_id == query_id]:
+            self._evict(key)
+
+    def _evict(self, key: bytes) -> None:
+        row = self._entries.pop(key)[0]
+        self._pool[row] = 0.0
+        self._row_keys[row] = None
+        self._free_rows.append(row)
 
 
 # =============================================================================
 # Qdrant Learning Client
 # =============================================================================
 
+@dataclass(slots=True)
+class _RoutingStats:
+    """Running outcome stats for one routing point, pending write-back."""
+    sample_count: int
+    success_rate: float
+    avg_latency_ms: float
+    success: Optional[bool] = None
+
+    def add(self, success: bool, latency_ms: int) -> None:
+        """Fold one outcome into the running means."""
+        self.sample_count += 1
+        self.success_rate += ((1.0 if success else 0.0) - self.success_rate) / self.sample_count
+        self.avg_latency_ms += (latency_ms - self.avg_latency_ms) / self.sample_count
+        self.success = success
+
+
+# routing_queries vectors are kept as int8 in RAM; searches scan the int8
+# index with 2x oversampling and rescore the candidates against float32
+QUERY_QUANTIZATION = {"scalar": {"type": "int8", "quantile": 0.99, "always_ram": True}}
+QUERY_SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# (config collection attribute, field, schema) indexed at startup: routing
+# queries filter on outcome stats and tool/layer; feedback looks up query_id;
+# epoch-ms timestamps allow time-range filters
+QUERY_PAYLOAD_INDEXES = (
+    ("collection_queries", "success", "bool"),
+    ("collection_queries", "success_rate", "float"),
+    ("collection_queries", "sample_count", "integer"),
+    ("collection_queries", "tool", "keyword"),
+    ("collection_queries", "execution_layer", "keyword"),
+    ("collection_queries", "timestamp", "integer"),
+    ("collection_outcomes", "query_id", "keyword"),
+    ("collection_outcomes", "timestamp", "integer"),
+)
+
+# Long-lived gRPC channel for searches: keepalive pings hold it open between
+# bursts, and the message cap leaves room for with_vector responses
+QDRANT_GRPC_OPTIONS = {
+    "grpc.keepalive_time_ms": 30000,
+    "grpc.keepalive_timeout_ms": 10000,
+    "grpc.max_send_message_length": 16 * 1024 * 1024,
+    "grpc.max_receive_message_length": 16 * 1024 * 1024,
+}
+
+
 class QdrantLearningClient:
     """
     Client for Qdrant-based query routing learning.
@@ -235,15 +569,43 @@ class QdrantLearningClient:
 
     def __init__(self, config: QdrantConfig):
         self.config = config
-        self._http = httpx.AsyncClient(timeout=30.0)
+        # REST calls use paths relative to the Qdrant URL over one keep-alive pool
+        self._http = httpx.AsyncClient(
+            base_url=config.url,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        self._qdrant = AsyncQdrantClient(
+            url=config.url,
+            grpc_port=config.grpc_port,
+            prefer_grpc=True,
+            timeout=30,
+            grpc_options=QDRANT_GRPC_OPTIONS,
+        )
         self._embedding = EmbeddingClient(config)
+        self._cache = (
+            _QueryCache(config.query_cache_size, config.query_cache_ttl_s, config.similarity_threshold)
+            if config.query_cache_size > 0
+            else None
+        )
+        # query_id -> centroid point id, for routings merged into an existing point
+        self._routing_points: OrderedDict[str, str] = OrderedDict()
+        # centroid point id -> lock serializing merges; dropped once no merge holds it
+        self._centroid_locks: "weakref.WeakValueDictionary[Any, asyncio.Lock]" = weakref.WeakValueDictionary()
+        # routing point id -> stats not yet written back to Qdrant
+        self._pending_stats: Dict[str, _RoutingStats] = {}
+        self._flushing_stats: Dict[str, _RoutingStats] = {}  # Written but not yet acknowledged
+        self._stats_task: Optional[asyncio.Task] = None
+        self._stats_stop = asyncio.Event()  # Set by close(); the loop flushes once more and exits
+        # Outcomes are payload-only; collections created with a dense vector get zeros
+        self._outcome_vector: Any = {}
         self._initialized = False
 
     async def initialize(self) -> bool:
         """Initialize the learning client."""
         try:
             # Check Qdrant connectivity
-            resp = await self._http.get(f"{self.config.url}/readyz")
+            resp = await self._http.get("/readyz")
             if resp.status_code != 200:
                 log.warning("qdrant_not_ready", status=resp.status_code)
                 return False
@@ -253,11 +615,30 @@ class QdrantLearningClient:
 
             # Verify collections exist
             for collection in [self.config.collection_queries, self.config.collection_outcomes]:
-                resp = await self._http.get(f"{self.config.url}/collections/{collection}")
+                resp = await self._http.get(f"/collections/{collection}")
                 if resp.status_code != 200:
-                    log.warning("qdrant_collection_missing", collection=collection)
-                    # Collections will be created by init job
-
+                    if collection == self.config.collection_outcomes:
+                        await self._create_outcomes_collection(collection)
+                    else:
+                        log.warning("qdrant_collection_missing", collection=collection)
+                        # Collections will be created by init job
+                    continue
+                collection_config = orjson.loads(resp.content).get("result", {}).get("config", {})
+                if collection == self.config.collection_queries:
+                    if not collection_config.get("quantization_config"):
+                        await self._enable_quantization(collection)
+                else:
+                    vectors = collection_config.get("params", {}).get("vectors", {})
+                    if "size" in vectors:
+                        # Pre-existing single-vector schema; recreate the collection to drop it
+                        self._outcome_vector = np.zeros(vectors["size"], dtype=np.float32)
+                        log.info("qdrant_outcomes_dense_vector", collection=collection, size=vectors["size"])
+
+            # Filtered fields are indexed so Qdrant applies filters during the HNSW search
+            for collection, field_name, field_schema in QUERY_PAYLOAD_INDEXES:
+                await self._create_payload_index(getattr(self.config, collection), field_name, field_schema)
+
+            self._stats_task = asyncio.create_task(self._stats_flush_loop())
             self._initialized = True
             log.info("qdrant_learning_initialized", url=self.config.url)
             return True
@@ -266,6 +647,46 @@ class QdrantLearningClient:
             log.error("qdrant_learning_init_error", error=str(e))
             return False
 
+    async def _create_outcomes_collection(self, collection: str) -> None:
+        """Create the outcomes collection payload-only (no vectors, no HNSW index)."""
+        resp = await self._http.put(
+            f"/collections/{collection}",
+            content=orjson.dumps({"vectors": {}}),
+            headers=_JSON_HEADERS
+        )
+        if resp.status_code != 200:
+            log.warning("qdrant_collection_create_error", collection=collection, status=resp.status_code)
+        else:
+            log.info("qdrant_collection_created", collection=collection)
+
+    async def _create_payload_index(self, collection: str, field_name: str, field_schema: str) -> None:
+        """Index a payload field for filtering (a no-op if the index already exists)."""
+        resp = await self._http.put(
+            f"/collections/{collection}/index",
+            content=orjson.dumps({"field_name": field_name, "field_schema": field_schema}),
+            headers=_JSON_HEADERS,
+            params={"wait": "true"}
+        )
+        if resp.status_code != 200:
+            log.warning(
+                "qdrant_payload_index_error",
+                collection=collection,
+                field=field_name,
+                status=resp.status_code
+            )
+
+    async def _enable_quantization(self, collection: str) -> None:
+        """Turn on int8 scalar quantization for a collection (applied by Qdrant in the background)."""
+        resp = await self._http.patch(
+            f"/collections/{collection}",
+            content=orjson.dumps({"quantization_config": QUERY_QUANTIZATION}),
+            headers=_JSON_HEADERS
+        )
+        if resp.status_code != 200:
+            log.warning("qdrant_quantization_error", collection=collection, status=resp.status_code)
+        else:
+            log.info("qdrant_quantization_enabled", collection=collection)
+
     # -------------------------------------------------------------------------
     # Similarity Search
     # -------------------------------------------------------------------------
@@ -296,35 +717,54 @@ class QdrantLearningClient:
         min_success = min_success_rate or self.config.min_success_rate
 
         try:
+            # Serve repeats of a recent hit without embedding or searching
+            cache_key = _QueryCache.key(query) if self._cache else None
+            if self._cache:
+                cached = self._cache.get(cache_key)
+                if cached and cached.success_rate >= min_success:
+                    log.debug("similar_route_cache_hit", query=query[:50], match="exact")
+                    return cached
+
             # Embed the query
             start = time.time()
             embedding = await self._embedding.embed(query)
             embed_time = (time.time() - start) * 1000
 
+            # Near-duplicates of a recent hit are matched in-process
+            if self._cache:
+                hit = self._cache.get_similar(embedding)
+                cached, inserted_at = hit if hit else (None, None)
+                if cached and cached.success_rate >= min_success:
+                    self._cache.put(cache_key, embedding, cached, inserted_at)
+                    log.debug(
+                        "similar_route_cache_hit",
+                        query=query[:50],
+                        match="semantic",
+                        similarity=round(cached.similarity, 3),
+                    )
+                    return cached
+
             # Search Qdrant
             search_start = time.time()
-            resp = await self._http.post(
-                f"{self.config.url}/collections/{self.config.collection_queries}/points/search",
-                json={
-                    "vector": embedding,
-                    "limit": 5,
-                    "with_payload": True,
-                    "score_threshold": self.config.similarity_threshold,
-                    "filter": {
-                        "must": [
-                            {"key": "success", "match": {"value": True}}
-                        ]
-                    }
-                }
+            results = await self._qdrant.search(
+                collection_name=self.config.collection_queries,
+                query_vector=embedding,
+                limit=1,
+                with_payload=True,
+                score_threshold=self.config.similarity_threshold,
+                search_params=QUERY_SEARCH_PARAMS,
+                query_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(key="success", match=models.MatchValue(value=True)),
+                        models.FieldCondition(key="success_rate", range=models.Range(gte=min_success)),
+                        models.FieldCondition(
+                            key="sample_count", range=models.Range(gte=self.config.min_samples)
+                        ),
+                    ]
+                ),
             )
             search_time = (time.time() - search_start) * 1000
 
-            if resp.status_code != 200:
-                log.warning("qdrant_search_error", status=resp.status_code)
-                return None
-
-            results = resp.json().get("result", [])
-
             if not results:
                 log.debug(
                     "no_similar_route_found",
@@ -334,44 +774,34 @@ class QdrantLearningClient:
                 )
                 return None
 
-            # Find best result with sufficient success rate
-            for result in results:
-                payload = result.get("payload", {})
-                success_rate = payload.get("success_rate", 0)
-                sample_count = payload.get("sample_count", 0)
-
-                if success_rate >= min_success and sample_count >= self.config.min_samples:
-                    similar = SimilarRoute(
-                        query_id=payload.get("query_id", str(result.get("id"))),
-                        query_text=payload.get("query_text", ""),
-                        similarity=result.get("score", 0),
-                        route_type=RouteType(payload.get("route_type", "similarity")),
-                        tool=payload.get("tool", ""),
-                        execution_layer=payload.get("execution_layer", ""),
-                        success_rate=success_rate,
-                        sample_count=sample_count,
-                        avg_latency_ms=payload.get("avg_latency_ms", 0),
-                    )
-
-                    log.info(
-                        "similar_route_found",
-                        query=query[:50],
-                        similarity=round(similar.similarity, 3),
-                        tool=similar.tool,
-                        success_rate=round(similar.success_rate, 2),
-                        samples=similar.sample_count,
-                        embed_ms=round(embed_time, 1),
-                        search_ms=round(search_time, 1)
-                    )
-                    return similar
+            # Filters already enforce success rate and sample count
+            result = results[0]
+            payload = result.payload or {}
+            similar = SimilarRoute(
+                query_id=payload.get("query_id", str(result.id)),
+                query_text=payload.get("query_text", ""),
+                similarity=result.score,
+                route_type=RouteType(payload.get("route_type", "similarity")),
+                tool=payload.get("tool", ""),
+                execution_layer=payload.get("execution_layer", ""),
+                success_rate=payload.get("success_rate", 0),
+                sample_count=payload.get("sample_count", 0),
+                avg_latency_ms=payload.get("avg_latency_ms", 0),
+            )
 
-            log.debug(
-                "similar_routes_insufficient",
+            log.info(
+                "similar_route_found",
                 query=query[:50],
-                candidates=len(results),
-                min_success=min_success
+                similarity=round(similar.similarity, 3),
+                tool=similar.tool,
+                success_rate=round(similar.success_rate, 2),
+                samples=similar.sample_count,
+                embed_ms=round(embed_time, 1),
+                search_ms=round(search_time, 1)
             )
-            return None
+            if self._cache:
+                self._cache.put(cache_key, embedding, similar)
+            return similar
 
         except Exception as e:
             log.error("find_similar_route_error", error=str(e), query=query[:50])
@@ -387,11 +817,18 @@ class QdrantLearningClient:
 
         This is called after a query is routed, before execution.
         The outcome will be linked later via store_outcome().
+
+        A decision whose query is a near-duplicate of an existing point with
+        the same tool and layer is folded into that point (running-mean
+        vector, member count) instead of adding a new one.
         """
         if not self._initialized:
             return False
 
         try:
+            if await self._merge_into_centroid(decision):
+                return True
+
             point = {
                 "id": decision.query_id,
                 "vector": decision.query_embedding,
@@ -402,18 +839,21 @@ class QdrantLearningClient:
                     "tool": decision.tool,
                     "execution_layer": decision.execution_layer,
                     "confidence": decision.confidence,
-                    "timestamp": decision.timestamp.isoformat(),
+                    "timestamp": decision.timestamp,
                     "success": None,  # Updated by outcome
                     "success_rate": 0.0,
                     "sample_count": 1,
                     "avg_latency_ms": 0,
+                    "member_count": 1,
+                    "member_query_ids": [decision.query_id],
                     **decision.metadata,
                 }
             }
 
             resp = await self._http.put(
-                f"{self.config.url}/collections/{self.config.collection_queries}/points",
-                json={"points": [point]},
+                f"/collections/{self.config.collection_queries}/points",
+                content=orjson.dumps({"points": [point]}, option=orjson.OPT_SERIALIZE_NUMPY),
+                headers=_JSON_HEADERS,
                 params={"wait": "true"}
             )
 
@@ -433,6 +873,98 @@ class QdrantLearningClient:
             log.error("store_routing_error", error=str(e))
             return False
 
+    async def _merge_into_centroid(self, decision: RoutingDecision) -> bool:
+        """
+        Fold the decision into a near-duplicate centroid point, if one exists.
+
+        Merges into one centroid are serialized per process and re-read the
+        point under the lock, so concurrent decisions each count. Replicas
+        merging into the same centroid at once can still drop a member.
+        """
+        if self.config.centroid_threshold > 1.0:
+            return False
+
+        try:
+            results = await self._qdrant.search(
+                collection_name=self.config.collection_queries,
+                query_vector=decision.query_embedding,
+                limit=1,
+                score_threshold=self.config.centroid_threshold,
+                search_params=QUERY_SEARCH_PARAMS,
+                query_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(key="tool", match=models.MatchValue(value=decision.tool)),
+                        models.FieldCondition(
+                            key="execution_layer", match=models.MatchValue(value=decision.execution_layer)
+                        ),
+                    ]
+                ),
+            )
+        except Exception as e:
+            # Fall back to storing a new point
+            log.warning("routing_centroid_search_error", error=str(e))
+            return False
+        if not results:
+            return False
+
+        centroid = results[0]
+        centroid_id = centroid.id
+        lock = self._centroid_locks.get(centroid_id)
+        if lock is None:
+            lock = self._centroid_locks[centroid_id] = asyncio.Lock()
+
+        async with lock:
+            # The search result may predate a merge that held the lock meanwhile
+            points = await self._qdrant.retrieve(
+                collection_name=self.config.collection_queries,
+                ids=[centroid_id],
+                with_payload=True,
+                with_vectors=True,
+            )
+            if not points:
+                return False
+            payload = points[0].payload or {}
+            count = payload.get("member_count", 1)
+            vector = (
+                np.asarray(points[0].vector, dtype=np.float32) * count
+                + decision.query_embedding
+            ) / (count + 1)
+            members = payload.get("member_query_ids", []) + [decision.query_id]
+            members = members[-self.config.centroid_max_members:]
+
+            # Vector and membership only; outcome stats stay with _update_routing_stats
+            resp = await self._http.post(
+                f"/collections/{self.config.collection_queries}/points/batch",
+                content=orjson.dumps({
+                    "operations": [
+                        {"update_vectors": {"points": [{"id": centroid_id, "vector": vector}]}},
+                        {"set_payload": {
+                            "points": [centroid_id],
+                            "payload": {"member_count": count + 1, "member_query_ids": members},
+                        }},
+                    ]
+                }, option=orjson.OPT_SERIALIZE_NUMPY),
+                headers=_JSON_HEADERS,
+                params={"wait": "true"}
+            )
+            if resp.status_code != 200:
+                log.warning("routing_centroid_merge_error", status=resp.status_code)
+                return False
+
+        # Popped when the outcome arrives; bounded in case it never does
+        self._routing_points[decision.query_id] = str(centroid_id)
+        if len(self._routing_points) > 10000:
+            self._routing_points.popitem(last=False)
+
+        log.debug(
+            "routing_merged",
+            query_id=decision.query_id,
+            centroid_id=centroid_id,
+            similarity=round(centroid.score, 3),
+            members=count + 1
+        )
+        return True
+
     # -------------------------------------------------------------------------
     # Store Outcome
     # -------------------------------------------------------------------------
@@ -448,28 +980,34 @@ class QdrantLearningClient:
             return False
 
         try:
-            # Update the routing_queries point
-            await self._update_routing_stats(outcome)
+            # Update the routing_queries point (the centroid, if the routing was merged)
+            routing_point_id = self._routing_points.pop(outcome.query_id, outcome.query_id)
+            if not outcome.success and self._cache:
+                # Stop serving the route before its Qdrant stats catch up
+                self._cache.evict_route(routing_point_id)
+            await self._update_routing_stats(outcome, routing_point_id)
 
             # Store detailed outcome
             outcome_point = {
                 "id": outcome.outcome_id,
-                "vector": [0.0] * 384,  # Placeholder - outcomes don't need similarity search
+                "vector": self._outcome_vector,  # Outcomes don't need similarity search
                 "payload": {
                     "outcome_id": outcome.outcome_id,
                     "query_id": outcome.query_id,
+                    "routing_point_id": routing_point_id,
                     "success": outcome.success,
                     "latency_ms": outcome.latency_ms,
                     "error_type": outcome.error_type,
                     "result_summary": outcome.result_summary,
                     "user_feedback": outcome.user_feedback,
-                    "timestamp": outcome.timestamp.isoformat(),
+                    "timestamp": outcome.timestamp,
                 }
             }
 
             resp = await self._http.put(
-                f"{self.config.url}/collections/{self.config.collection_outcomes}/points",
-                json={"points": [outcome_point]},
+                f"/collections/{self.config.collection_outcomes}/points",
+                content=orjson.dumps({"points": [outcome_point]}, option=orjson.OPT_SERIALIZE_NUMPY),
+                headers=_JSON_HEADERS,
                 params={"wait": "true"}
             )
 
@@ -489,46 +1027,99 @@ class QdrantLearningClient:
             log.error("store_outcome_error", error=str(e))
             return False
 
-    async def _update_routing_stats(self, outcome: RoutingOutcome) -> None:
-        """Update success rate and latency stats for a routing."""
-        try:
-            # Get current stats
-            resp = await self._http.get(
-                f"{self.config.url}/collections/{self.config.collection_queries}/points/{outcome.query_id}"
-            )
+    async def _update_routing_stats(self, outcome: RoutingOutcome, routing_point_id: str) -> None:
+        """
+        Update success rate and latency stats for a routing.
 
-            if resp.status_code != 200:
-                return
+        Stats are read from Qdrant once per flush window, updated in-process,
+        and written back by _flush_stats() with every other dirty routing.
+        """
+        try:
+            stats = self._pending_stats.get(routing_point_id)
+            if stats is None and routing_point_id in self._flushing_stats:
+                # Qdrant may not have applied the in-flight write yet; continue from it
+                stats = self._pending_stats.setdefault(
+                    routing_point_id, replace(self._flushing_stats[routing_point_id])
+                )
+            if stats is None:
+                # Get current stats
+                resp = await self._http.get(
+                    f"/collections/{self.config.collection_queries}/points/{routing_point_id}"
+                )
 
-            point = resp.json().get("result", {})
-            payload = point.get("payload", {})
+                if resp.status_code != 200:
+                    return
 
-            # Calculate new stats
-            old_count = payload.get("sample_count", 0)
-            old_success_rate = payload.get("success_rate", 0)
-            old_avg_latency = payload.get("avg_latency_ms", 0)
+                payload = orjson.loads(resp.content).get("result", {}).get("payload", {})
+                # A concurrent outcome for the same routing may have loaded it meanwhile
+                stats = self._pending_stats.setdefault(routing_point_id, _RoutingStats(
+                    sample_count=payload.get("sample_count", 0),
+                    success_rate=payload.get("success_rate", 0),
+                    avg_latency_ms=payload.get("avg_latency_ms", 0),
+                ))
 
-            new_count = old_count + 1
-            new_success_rate = ((old_success_rate * old_count) + (1 if outcome.success else 0)) / new_count
-            new_avg_latency = ((old_avg_latency * old_count) + outcome.latency_ms) / new_count
+            stats.add(outcome.success, outcome.latency_ms)
 
-            # Update payload
-            await self._http.post(
-                f"{self.config.url}/collections/{self.config.collection_queries}/points/payload",
-                json={
-                    "points": [outcome.query_id],
-                    "payload": {
-                        "success": outcome.success,
-                        "success_rate": new_success_rate,
-                        "sample_count": new_count,
-                        "avg_latency_ms": new_avg_latency,
-                    }
-                }
-            )
+            if len(self._pending_stats) >= self.config.stats_flush_size:
+                await self._flush_stats()
 
         except Exception as e:
             log.error("update_routing_stats_error", error=str(e))
 
+    async def _flush_stats(self) -> None:
+        """Write all pending routing stats back in one batch request."""
+        if not self._pending_stats:
+            return
+        pending, self._pending_stats = self._pending_stats, {}
+        self._flushing_stats.update(pending)
+
+        try:
+            resp = await self._http.post(
+                f"/collections/{self.config.collection_queries}/points/batch",
+                content=orjson.dumps({
+                    "operations": [
+                        {"set_payload": {
+                            "points": [point_id],
+                            "payload": {
+                                "success": stats.success,
+                                "success_rate": stats.success_rate,
+                                "sample_count": stats.sample_count,
+                                "avg_latency_ms": stats.avg_latency_ms,
+                            },
+                        }}
+                        for point_id, stats in pending.items()
+                    ]
+                }),
+                headers=_JSON_HEADERS,
+                # Applied before returning, so a later stats load can't read older values
+                params={"wait": "true"}
+            )
+            if resp.status_code != 200:
+                log.warning("routing_stats_flush_error", status=resp.status_code, routings=len(pending))
+                self._requeue_stats(pending)
+        except Exception as e:
+            log.error("routing_stats_flush_error", error=str(e), routings=len(pending))
+            self._requeue_stats(pending)
+        finally:
+            for point_id, stats in pending.items():
+                if self._flushing_stats.get(point_id) is stats:
+                    del self._flushing_stats[point_id]
+
+    def _requeue_stats(self, failed: Dict[str, _RoutingStats]) -> None:
+        """Return stats from a failed flush to the pending set for the next tick."""
+        for point_id, stats in failed.items():
+            # Stats pending since the flush started were continued from these; keep them
+            self._pending_stats.setdefault(point_id, stats)
+
+    async def _stats_flush_loop(self) -> None:
+        """Periodically write back pending routing stats until close()."""
+        while not self._stats_stop.is_set():
+            try:
+                await asyncio.wait_for(self._stats_stop.wait(), self.config.stats_flush_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            await self._flush_stats()
+
     # -------------------------------------------------------------------------
     # User Feedback
     # -------------------------------------------------------------------------
@@ -550,8 +1141,8 @@ class QdrantLearningClient:
         try:
             # Find the outcome for this query
             resp = await self._http.post(
-                f"{self.config.url}/collections/{self.config.collection_outcomes}/points/scroll",
-                json={
+                f"/collections/{self.config.collection_outcomes}/points/scroll",
+                content=orjson.dumps({
                     "filter": {
                         "must": [
                             {"key": "query_id", "match": {"value": query_id}}
@@ -559,35 +1150,41 @@ class QdrantLearningClient:
                     },
                     "limit": 1,
                     "with_payload": True
-                }
+                }),
+                headers=_JSON_HEADERS
             )
 
             if resp.status_code != 200:
                 return False
 
-            points = resp.json().get("result", {}).get("points", [])
+            points = orjson.loads(resp.content).get("result", {}).get("points", [])
             if not points:
                 return False
 
             # Update feedback
             outcome_id = points[0].get("id")
+            routing_point_id = points[0].get("payload", {}).get("routing_point_id", query_id)
             await self._http.post(
-                f"{self.config.url}/collections/{self.config.collection_outcomes}/points/payload",
-                json={
+                f"/collections/{self.config.collection_outcomes}/points/payload",
+                content=orjson.dumps({
                     "points": [outcome_id],
                     "payload": {"user_feedback": feedback}
-                }
+                }),
+                headers=_JSON_HEADERS
             )
 
             # Adjust routing success rate based on feedback
             if feedback == "negative":
+                if self._cache:
+                    self._cache.evict_route(routing_point_id)
                 # Decrease success rate to reduce future reuse
                 await self._http.post(
-                    f"{self.config.url}/collections/{self.config.collection_queries}/points/payload",
-                    json={
-                        "points": [query_id],
+                    f"/collections/{self.config.collection_queries}/points/payload",
+                    content=orjson.dumps({
+                        "points": [routing_point_id],
                         "payload": {"success_rate_adjustment": -0.1}
-                    }
+                    }),
+                    headers=_JSON_HEADERS
                 )
 
             log.info("feedback_recorded", query_id=query_id, feedback=feedback)
@@ -603,7 +1200,14 @@ class QdrantLearningClient:
 
     async def close(self) -> None:
         """Close the client."""
+        if self._stats_task:
+            # Not cancelled: an in-flight flush completes, then the loop flushes once more
+            self._stats_stop.set()
+            await asyncio.gather(self._stats_task, return_exceptions=True)
+            self._stats_task = None
+        await self._flush_stats()
         await self._http.aclose()
+        await self._qdrant.close()
         await self._embedding.close()
         log.info("qdrant_learning_closed")
 
@@ -11,11 +11,18 @@ Security: Only allowlisted commands can be executed.
 
 import os
 import asyncio
+import logging
 import re
-from typing import Optional, Any
-from dataclasses import dataclass
-from fastapi import FastAPI, HTTPException
+import sys
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Optional, Any, Callable, Mapping
+from dataclasses import dataclass, field
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel
+import orjson
 import structlog
 
 # Try to import asyncssh, fall back to paramiko if not available
@@ -25,6 +32,29 @@ try:
 except ImportError:
     SSH_LIB = None
 
+# =============================================================================
+# Logging
+# =============================================================================
+
+LOG_LEVEL = logging.getLevelNamesMapping().get(os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
+# JSON lines rendered by orjson; events below LOG_LEVEL are dropped before
+# any processor runs
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
+    logger_factory=structlog.BytesLoggerFactory(),
+    cache_logger_on_first_use=True,
+)
+
+log = structlog.get_logger().bind(service="ssh-gateway")
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -36,23 +66,39 @@ class SSHConfig:
     password: str
     port: int = 22
     timeout: int = 30
-    max_connections: int = 5
+    max_connections: int = 5  # Concurrent sessions on the shared connection
+    keepalive_interval: int = 30
 
 
-@dataclass
+# {param} placeholders in allowlisted command strings, shared by all commands
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+@dataclass(frozen=True, slots=True)
 class AllowedCommand:
     name: str
     command: str
     category: str
     risk_level: str
     params: list = None
+    params_by_name: dict[str, dict] = field(init=False, repr=False)
+    validators: dict[str, re.Pattern] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Index params and compile validation patterns once at registry construction
+        object.__setattr__(self, "params_by_name", {p["name"]: p for p in self.params or ()})
+        object.__setattr__(self, "validators", {
+            p["name"]: re.compile(p["validation"])
+            for p in self.params or ()
+            if p.get("validation")
+        })
 
 
 # =============================================================================
 # Command Registry
 # =============================================================================
 
-ALLOWED_COMMANDS: dict[str, AllowedCommand] = {
+_ALLOWED_COMMANDS: dict[str, AllowedCommand] = {
     # System info
     "get_system_info": AllowedCommand(
         name="get_system_info",
@@ -174,12 +220,28 @@ ALLOWED_COMMANDS: dict[str, AllowedCommand] = {
     ),
 }
 
+# Read-only at runtime, with interned keys
+ALLOWED_COMMANDS: Mapping[str, AllowedCommand] = MappingProxyType(
+    {sys.intern(name): cmd for name, cmd in _ALLOWED_COMMANDS.items()}
+)
+
+# The allowlist never changes at runtime, so /commands is serialized once
+_COMMANDS_JSON = orjson.dumps({
+    name: {
+        "category": cmd.category,
+        "risk_level": cmd.risk_level,
+        "params": cmd.params
+    }
+    for name, cmd in ALLOWED_COMMANDS.items()
+})
+
 # Blocked patterns for security
 BLOCKED_PATTERNS = [
     "rm -rf", "mkfs", "dd if=", "> /dev/", "chmod 777",
     "wget ", "curl ", "nc ", "ncat ", "bash -i", "sh -i",
     "/bin/sh", "eval ", "exec ", "`", "$("
 ]
+_BLOCKED_RE = re.compile("|".join(re.escape(p) for p in BLOCKED_PATTERNS))
 
 
 # =============================================================================
@@ -208,49 +270,56 @@ class SSHGateway:
 
     def __init__(self, config: SSHConfig):
         self.config = config
-        self.log = structlog.get_logger()
+        self.log = log
         self._connected = False
+        # One long-lived connection; commands run as sessions multiplexed over it
+        self._conn = None
+        self._conn_lock = asyncio.Lock()
+        self._session_sem = asyncio.Semaphore(config.max_connections)
 
     async def execute(self, command_name: str, params: dict = None) -> dict:
         """Execute an allowlisted command."""
         # Check if command is allowed
-        if command_name not in ALLOWED_COMMANDS:
+        allowed = ALLOWED_COMMANDS.get(command_name)
+        if allowed is None:
             return {
                 "success": False,
                 "error": f"Command not allowed: {command_name}"
             }
 
-        allowed = ALLOWED_COMMANDS[command_name]
         command = allowed.command
 
         # Substitute parameters
         if params:
+            values = {}
             for key, value in params.items():
+                sval = value if isinstance(value, str) else str(value)
                 # Validate parameters if validation pattern exists
-                if allowed.params:
-                    for p in allowed.params:
-                        if p.get("name") == key and p.get("validation"):
-                            if not re.match(p["validation"], str(value)):
-                                return {
-                                    "success": False,
-                                    "error": f"Invalid parameter value for {key}"
-                                }
-                        # Check max limits
-                        if p.get("name") == key and p.get("max"):
-                            try:
-                                if int(value) > int(p["max"]):
-                                    value = p["max"]
-                            except ValueError:
-                                pass
-                command = command.replace(f"{{{key}}}", str(value))
+                validator = allowed.validators.get(key)
+                if validator and not validator.match(sval):
+                    return {
+                        "success": False,
+                        "error": f"Invalid parameter value for {key}"
+                    }
+                # Check max limits
+                spec = allowed.params_by_name.get(key)
+                if spec and spec.get("max"):
+                    try:
+                        if int(value) > int(spec["max"]):
+                            sval = str(spec["max"])
+                    except ValueError:
+                        pass
+                values[key] = sval
+            # One pass over the command; placeholders without a value are kept
+            command = _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), command)
 
         # Check for blocked patterns in final command
-        for pattern in BLOCKED_PATTERNS:
-            if pattern in command:
-                return {
-                    "success": False,
-                    "error": f"Blocked pattern detected: {pattern}"
-                }
+        blocked = _BLOCKED_RE.search(command)
+        if blocked:
+            return {
+                "success": False,
+                "error": f"Blocked pattern detected: {blocked.group(0)}"
+            }
 
         self.log.info("ssh_executing", command=command_name)
 
@@ -269,22 +338,47 @@ class SSHGateway:
                 "error": str(e)
             }
 
+    async def _get_conn(self):
+        """Return the shared SSH connection, reconnecting if it was closed."""
+        async with self._conn_lock:
+            if self._conn is None or self._conn.is_closed():
+                self._conn = await asyncssh.connect(
+                    self.config.host,
+                    port=self.config.port,
+                    username=self.config.username,
+                    password=self.config.password,
+                    known_hosts=None,
+                    keepalive_interval=self.config.keepalive_interval
+                )
+                self.log.info("ssh_connected", host=self.config.host)
+            return self._conn
+
     async def _execute_asyncssh(self, command: str) -> dict:
         """Execute command using asyncssh."""
-        async with asyncssh.connect(
-            self.config.host,
-            port=self.config.port,
-            username=self.config.username,
-            password=self.config.password,
-            known_hosts=None
-        ) as conn:
-            result = await conn.run(command, timeout=self.config.timeout)
-            return {
-                "success": result.exit_status == 0,
-                "output": result.stdout,
-                "error": result.stderr if result.stderr else None,
-                "exit_code": result.exit_status
-            }
+        async with self._session_sem:
+            conn = await self._get_conn()
+            try:
+                result = await conn.run(command, timeout=self.config.timeout)
+            except asyncssh.ChannelOpenError:
+                if not conn.is_closed():
+                    raise
+                # Connection dropped while idle; the command never started
+                conn = await self._get_conn()
+                result = await conn.run(command, timeout=self.config.timeout)
+        return {
+            "success": result.exit_status == 0,
+            "output": result.stdout,
+            "error": result.stderr if result.stderr else None,
+            "exit_code": result.exit_status
+        }
+
+    async def close(self) -> None:
+        """Close the shared SSH connection."""
+        async with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                await self._conn.wait_closed()
+                self._conn = None
 
     async def test_connection(self) -> bool:
         """Test SSH connectivity."""
@@ -299,36 +393,71 @@ class SSHGateway:
 # FastAPI Application
 # =============================================================================
 
-app = FastAPI(
-    title="UniFi SSH Gateway",
-    description="Secure SSH execution layer for UniFi diagnostics",
-    version="0.1.0"
+class _ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that hands endpoints an orjson-decoding request."""
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            return await original_handler(_ORJSONRequest(request.scope, request.receive))
+
+        return handler
+
+
+# SSH settings are read once at import; the gateway itself is created per process
+_SSH_HOST = os.getenv("SSH_HOST")
+_SSH_USERNAME = os.getenv("SSH_USERNAME")
+_SSH_PASSWORD = os.getenv("SSH_PASSWORD")
+
+SSH_CONFIG: Optional[SSHConfig] = (
+    SSHConfig(
+        host=_SSH_HOST,
+        username=_SSH_USERNAME,
+        password=_SSH_PASSWORD,
+        port=int(os.getenv("SSH_PORT", "22")),
+        timeout=int(os.getenv("SSH_TIMEOUT", "30")),
+        max_connections=int(os.getenv("SSH_MAX_CONNECTIONS", "5"))
+    )
+    if _SSH_HOST and _SSH_USERNAME and _SSH_PASSWORD
+    else None
 )
 
 ssh_gateway: Optional[SSHGateway] = None
-log = structlog.get_logger()
 
 
-@app.on_event("startup")
-async def startup():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager."""
     global ssh_gateway
 
-    host = os.getenv("SSH_HOST")
-    username = os.getenv("SSH_USERNAME")
-    password = os.getenv("SSH_PASSWORD")
-    port = int(os.getenv("SSH_PORT", "22"))
-    timeout = int(os.getenv("SSH_TIMEOUT", "30"))
-
-    if host and username and password:
-        config = SSHConfig(
-            host=host,
-            username=username,
-            password=password,
-            port=port,
-            timeout=timeout
-        )
-        ssh_gateway = SSHGateway(config)
-        log.info("ssh_gateway_initialized", host=host)
+    if SSH_CONFIG:
+        ssh_gateway = SSHGateway(SSH_CONFIG)
+        log.info("ssh_gateway_initialized", host=SSH_CONFIG.host)
+
+    yield
+
+    if ssh_gateway:
+        await ssh_gateway.close()
+
+
+app = FastAPI(
+    title="UniFi SSH Gateway",
+    description="Secure SSH execution layer for UniFi diagnostics",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+app.router.route_class = ORJSONRoute
 
 
 @app.get("/health")
@@ -346,14 +475,7 @@ async def ready():
 @app.get("/commands")
 async def list_commands():
     """List all available commands."""
-    return {
-        name: {
-            "category": cmd.category,
-            "risk_level": cmd.risk_level,
-            "params": cmd.params
-        }
-        for name, cmd in ALLOWED_COMMANDS.items()
-    }
+    return Response(content=_COMMANDS_JSON, media_type="application/json")
 
 
 @app.post("/execute", response_model=ExecuteResponse)
@@ -379,4 +501,4 @@ async def execute_command(request: ExecuteRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools", access_log=False)
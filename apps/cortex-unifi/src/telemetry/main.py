@@ -9,16 +9,37 @@ Captures operational telemetry for:
 """
 
 import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel
-from prometheus_client import Counter, Histogram, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+import orjson
 import structlog
 
-log = structlog.get_logger()
+LOG_LEVEL = logging.getLevelNamesMapping().get(os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
+# JSON lines rendered by orjson; events below LOG_LEVEL are dropped before
+# any processor runs
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
+    logger_factory=structlog.BytesLoggerFactory(),
+    cache_logger_on_first_use=True,
+)
+
+log = structlog.get_logger().bind(service="telemetry")
 
 # =============================================================================
 # Metrics
@@ -30,6 +51,12 @@ TELEMETRY_EVENTS = Counter(
     ['event_type']
 )
 
+# Pre-bound children for the documented event types (plus "dropped")
+_EVENT_COUNTERS = {
+    event_type: TELEMETRY_EVENTS.labels(event_type=event_type)
+    for event_type in ("query", "tool_call", "outcome", "error", "dropped")
+}
+
 QDRANT_WRITES = Counter(
     'cortex_telemetry_qdrant_writes_total',
     'Total writes to Qdrant',
@@ -55,16 +82,174 @@ class TelemetryEvent(BaseModel):
 # FastAPI Application
 # =============================================================================
 
+class _ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that hands endpoints an orjson-decoding request."""
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            return await original_handler(_ORJSONRequest(request.scope, request.receive))
+
+        return handler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager."""
+    queue = app.state.event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    event_task = asyncio.create_task(_drain_events(queue))
+
+    yield
+
+    # Not cancelled: the drain task processes what it has collected, then exits.
+    # put() rather than put_nowait() so a full queue can't lose the sentinel.
+    if not event_task.done():
+        await queue.put(_STOP)
+    await asyncio.gather(event_task, return_exceptions=True)
+
+    # Anything the drain task never reached (it died, or events arrived late)
+    remaining = []
+    while not queue.empty():
+        item = queue.get_nowait()
+        if item is not _STOP:
+            remaining.append(item)
+    if remaining:
+        await _process_events(remaining)
+
+
 app = FastAPI(
     title="Cortex Telemetry",
     description="Telemetry and learning pipeline for UniFi Layer Fabric",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
+app.router.route_class = ORJSONRoute
 
 # Configuration
 QDRANT_ENDPOINT = os.getenv("QDRANT_ENDPOINT", "http://cortex-qdrant:6333")
 TRAINING_PATH = os.getenv("TRAINING_PATH", "/data/training")
+TRAINING_ENABLED = os.getenv("TRAINING_ENABLED", "false").lower() == "true"
+# events.jsonl is rotated at this size, keeping this many older files
+# (events.jsonl.1 newest); together they must fit the training volume
+TRAINING_MAX_BYTES = int(os.getenv("TRAINING_MAX_BYTES", str(100 * 1024 * 1024)))
+TRAINING_BACKUPS = int(os.getenv("TRAINING_BACKUPS", "3"))
+
+# Events are queued and processed off the request path: flush after N events
+# or W milliseconds, whichever first; a full queue drops new events
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "10000"))
+EVENT_BATCH_SIZE = int(os.getenv("EVENT_BATCH_SIZE", "100"))
+EVENT_BATCH_WINDOW_MS = int(os.getenv("EVENT_BATCH_WINDOW_MS", "50"))
+
+
+# =============================================================================
+# Event Pipeline
+# =============================================================================
+
+# Queued as (event_type, event): /query and /outcome override the body's type
+QueuedEvent = tuple[str, TelemetryEvent]
+
+
+def _append_training(batch: list[QueuedEvent]) -> None:
+    """Append a batch of events to the training JSONL file, rotating it when full."""
+    data = b"".join(
+        orjson.dumps({**event.model_dump(), "event_type": event_type}) + b"\n"
+        for event_type, event in batch
+    )
+    os.makedirs(TRAINING_PATH, exist_ok=True)
+    path = os.path.join(TRAINING_PATH, "events.jsonl")
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        size = 0
+
+    if size and size + len(data) > TRAINING_MAX_BYTES:
+        # events.jsonl -> .1 -> ... -> .N; the oldest file is dropped
+        for i in range(TRAINING_BACKUPS - 1, 0, -1):
+            if os.path.exists(f"{path}.{i}"):
+                os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+        if TRAINING_BACKUPS > 0:
+            os.replace(path, f"{path}.1")
+        else:
+            os.remove(path)
+        log.info("training_file_rotated", bytes=size, backups=TRAINING_BACKUPS)
 
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+async def _process_events(batch: list[QueuedEvent]) -> None:
+    """Log a batch of events and persist it for training."""
+    if LOG_LEVEL <= logging.INFO:
+        for event_type, event in batch:
+            log.info(
+                "telemetry_event",
+                event_type=event_type,
+                query=event.query[:50] if event.query else None,
+                tool=event.tool,
+                success=event.success
+            )
+
+    # TODO: Write to Qdrant for pattern learning
+
+    if TRAINING_ENABLED:
+        try:
+            await asyncio.to_thread(_append_training, batch)
+        except OSError as e:
+            log.error("training_write_error", error=str(e), events=len(batch))
+
+
+# Queued at shutdown: the drain task processes its batch and exits
+_STOP = object()
+
+
+async def _drain_events(queue: asyncio.Queue) -> None:
+    """Process queued events in size/time-bounded batches until _STOP."""
+    loop = asyncio.get_running_loop()
+    window = EVENT_BATCH_WINDOW_MS / 1000
+
+    while True:
+        item = await queue.get()
+        if item is _STOP:
+            return
+        batch = [item]
+        deadline = loop.time() + window
+        stopping = False
+
+        while len(batch) < EVENT_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            batch.append(item)
+
+        try:
+            await _process_events(batch)
+        except Exception as e:
+            log.error("telemetry_batch_error", error=str(e), events=len(batch))
+        if stopping:
+            return
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
 
 @app.get("/health")
 async def health():
@@ -77,43 +262,45 @@ async def ready():
 
 
 @app.get("/metrics")
-async def metrics():
-    return generate_latest()
+def metrics():
+    # Rendered in the threadpool, returned as Prometheus text rather than JSON
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
-@app.post("/event")
-async def record_event(event: TelemetryEvent):
-    """Record a telemetry event."""
-    TELEMETRY_EVENTS.labels(event_type=event.event_type).inc()
-
-    log.info(
-        "telemetry_event",
-        event_type=event.event_type,
-        query=event.query[:50] if event.query else None,
-        tool=event.tool,
-        success=event.success
-    )
+def _record(event: TelemetryEvent, event_type: str) -> dict:
+    """Count an event and queue it for processing."""
+    counter = _EVENT_COUNTERS.get(event_type)
+    if counter is None:
+        counter = TELEMETRY_EVENTS.labels(event_type=event_type)
+    counter.inc()
 
-    # TODO: Write to Qdrant for pattern learning
-    # TODO: Write to training file for fine-tuning
+    try:
+        app.state.event_queue.put_nowait((event_type, event))
+    except asyncio.QueueFull:
+        _EVENT_COUNTERS["dropped"].inc()
+        return {"status": "dropped"}
 
     return {"status": "recorded"}
 
 
+@app.post("/event")
+async def record_event(event: TelemetryEvent):
+    """Record a telemetry event."""
+    return _record(event, event.event_type)
+
+
 @app.post("/query")
 async def record_query(event: TelemetryEvent):
     """Record a query event."""
-    event.event_type = "query"
-    return await record_event(event)
+    return _record(event, "query")
 
 
 @app.post("/outcome")
 async def record_outcome(event: TelemetryEvent):
     """Record an outcome event."""
-    event.event_type = "outcome"
-    return await record_event(event)
+    return _record(event, "outcome")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools", access_log=False)